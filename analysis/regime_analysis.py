@@ -12,16 +12,34 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
 import math
-import statistics
 from dataclasses import dataclass
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence
+from typing import Iterable, List, Sequence
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # noqa
+    orjson = None  # type: ignore
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # noqa
+    pa = None  # type: ignore
+    pa_csv = None  # type: ignore
+
+try:
+    import numba
+except ImportError:  # noqa
+    numba = None  # type: ignore
+
+
+@dataclass(slots=True, frozen=True)
 class PnLWindow:
     bucket_start_ts: int
     window_seconds: int
@@ -30,16 +48,29 @@ class PnLWindow:
     base_delta: float
 
 
-@dataclass
-class Candle:
-    open_time: int
-    open: float
-    high: float
-    low: float
-    close: float
+@dataclass(slots=True, frozen=True)
+class PnLWindows:
+    """Column-oriented rows of the PnL window CSV."""
+
+    bucket_start_ts: np.ndarray
+    window_seconds: np.ndarray
+    realized_quote: np.ndarray
+    maker_volume: np.ndarray
+    base_delta: np.ndarray
+
+
+@dataclass(slots=True, frozen=True)
+class Candles:
+    """Column-oriented 1m candles, sorted by open_time."""
 
+    open_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RegimeRow:
     pnl: PnLWindow
     price_return: float
@@ -67,158 +98,242 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_pnl_windows(path: Path) -> Sequence[PnLWindow]:
-    rows: List[PnLWindow] = []
-    with path.open("r", newline="", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        for row in reader:
-            rows.append(
-                PnLWindow(
-                    bucket_start_ts=int(float(row["bucket_start_ts"])),
-                    window_seconds=int(row["window_seconds"]),
-                    realized_quote=float(row["realized_quote"]),
-                    maker_volume=float(row["maker_volume"]),
-                    base_delta=float(row["base_delta"]),
+PNL_COLUMNS = (
+    "bucket_start_ts",
+    "window_seconds",
+    "realized_quote",
+    "maker_volume",
+    "base_delta",
+)
+
+
+def load_pnl_windows(path: Path) -> PnLWindows:
+    if pa_csv is not None and path.stat().st_size > 0:
+        # Multithreaded C reader; only the needed columns are parsed.
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=list(PNL_COLUMNS),
+                column_types={name: pa.float64() for name in PNL_COLUMNS},
+            ),
+        )
+        columns = [table.column(name).to_numpy() for name in PNL_COLUMNS]
+    else:
+        with path.open("r", newline="", encoding="utf-8") as fh:
+            header = next(csv.reader(fh), None)
+            if not header:
+                data = np.empty((0, len(PNL_COLUMNS)), dtype=np.float64)
+            else:
+                usecols = [header.index(name) for name in PNL_COLUMNS]
+                data = np.loadtxt(
+                    fh, delimiter=",", usecols=usecols, dtype=np.float64, ndmin=2
                 )
-            )
-    return rows
+        columns = [data[:, i] for i in range(len(PNL_COLUMNS))]
+    bucket_start_ts, window_seconds, realized_quote, maker_volume, base_delta = columns
+    return PnLWindows(
+        bucket_start_ts=bucket_start_ts.astype(np.int64),
+        window_seconds=window_seconds.astype(np.int64),
+        realized_quote=realized_quote,
+        maker_volume=maker_volume,
+        base_delta=base_delta,
+    )
 
 
-def load_candles(path: Path) -> Sequence[Candle]:
-    candles: List[Candle] = []
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    for row in data:
-        candles.append(
-            Candle(
-                open_time=int(row["open_time"]),
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-            )
-        )
-    candles.sort(key=lambda c: c.open_time)
-    return candles
-
-
-def slice_candles(
-    candles: Sequence[Candle], start_ms: int, end_ms: int
-) -> Sequence[Candle]:
-    window: List[Candle] = []
-    for candle in candles:
-        if candle.open_time >= end_ms:
-            break
-        if start_ms <= candle.open_time < end_ms:
-            window.append(candle)
-    return window
-
-
-def coalesce_windows(pnl_windows: Sequence[PnLWindow], window_ms: int) -> Sequence[PnLWindow]:
-    aggregates: Dict[int, Dict[str, float]] = defaultdict(lambda: {"realized": 0.0, "volume": 0.0, "base": 0.0})
-    for pnl in pnl_windows:
-        bucket_start = (pnl.bucket_start_ts // window_ms) * window_ms
-        agg = aggregates[bucket_start]
-        agg["realized"] += pnl.realized_quote
-        agg["volume"] += pnl.maker_volume
-        agg["base"] += pnl.base_delta
-
-    coalesced: List[PnLWindow] = []
-    for bucket_start in sorted(aggregates.keys()):
-        agg = aggregates[bucket_start]
-        coalesced.append(
-            PnLWindow(
-                bucket_start_ts=bucket_start,
-                window_seconds=window_ms // 1000,
-                realized_quote=agg["realized"],
-                maker_volume=agg["volume"],
-                base_delta=agg["base"],
-            )
+def load_candles(path: Path) -> Candles:
+    with path.open("rb") as fh:
+        data = orjson.loads(fh.read()) if orjson is not None else json.load(fh)
+
+    def column(key: str, dtype) -> np.ndarray:
+        # Plain list-comp, then one C-level conversion (numeric strings included).
+        return np.array([row[key] for row in data], dtype=dtype)
+
+    open_time = column("open_time", np.int64)
+    candles = Candles(
+        open_time=open_time,
+        open=column("open", np.float64),
+        high=column("high", np.float64),
+        low=column("low", np.float64),
+        close=column("close", np.float64),
+    )
+    if np.all(open_time[1:] >= open_time[:-1]):
+        # Exchange exports are normally already sorted; skip the reorder copies.
+        return candles
+    order = np.argsort(open_time, kind="stable")
+    return Candles(
+        open_time=candles.open_time[order],
+        open=candles.open[order],
+        high=candles.high[order],
+        low=candles.low[order],
+        close=candles.close[order],
+    )
+
+
+def coalesce_windows(pnl_windows: PnLWindows, window_ms: int) -> PnLWindows:
+    bucket_starts = (pnl_windows.bucket_start_ts // window_ms) * window_ms
+    buckets, inverse = np.unique(bucket_starts, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.bincount(inverse, weights=values, minlength=len(buckets))
+
+    return PnLWindows(
+        bucket_start_ts=buckets,
+        window_seconds=np.full(len(buckets), window_ms // 1000, dtype=np.int64),
+        realized_quote=total(pnl_windows.realized_quote),
+        maker_volume=total(pnl_windows.maker_volume),
+        base_delta=total(pnl_windows.base_delta),
+    )
+
+
+def make_window_features(window_ms: int, min_candles: int):
+    """
+    Build the per-window feature kernel for one run.
+
+    With numba, window_ms and min_candles are closure constants, so they are
+    folded into the compiled kernel. Returns fn(starts, open_time, open, high,
+    low, close) -> (valid, price_return, range_ratio, vol).
+    """
+    if numba is None:
+        return functools.partial(
+            _window_features_numpy, window_ms=window_ms, min_candles=min_candles
         )
-    return coalesced
+
+    def kernel(starts, open_time, open_, high, low, close):
+        n_windows = starts.shape[0]
+        valid = np.zeros(n_windows, dtype=np.bool_)
+        price_return = np.zeros(n_windows, dtype=np.float64)
+        range_ratio = np.zeros(n_windows, dtype=np.float64)
+        vol = np.zeros(n_windows, dtype=np.float64)
+        for w in numba.prange(n_windows):
+            lo = np.searchsorted(open_time, starts[w])
+            hi = np.searchsorted(open_time, starts[w] + window_ms)
+            if hi - lo < min_candles:
+                continue
+            open_price = open_[lo]
+            close_price = close[hi - 1]
+            if open_price <= 0 or close_price <= 0:
+                continue
+
+            high_px = high[lo]
+            low_px = low[lo]
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            prev_close = close[lo]
+            for i in range(lo + 1, hi):
+                if high[i] > high_px:
+                    high_px = high[i]
+                if low[i] < low_px:
+                    low_px = low[i]
+                if prev_close > 0:
+                    r = close[i] / prev_close - 1.0
+                    n += 1
+                    delta = r - mean
+                    mean += delta / n
+                    m2 += delta * (r - mean)
+                prev_close = close[i]
+
+            valid[w] = True
+            price_return[w] = close_price / open_price - 1.0
+            range_ratio[w] = (high_px - low_px) / open_price
+            vol[w] = math.sqrt(m2 / n) if n > 1 else 0.0
+        return valid, price_return, range_ratio, vol
+
+    return numba.njit(parallel=True, fastmath=True, boundscheck=False)(kernel)
+
+
+def _window_features_numpy(
+    starts, open_time, open_, high, low, close, *, window_ms, min_candles
+):
+    """Fallback kernel without numba, using NumPy reductions on each window slice."""
+    n_windows = starts.shape[0]
+    valid = np.zeros(n_windows, dtype=np.bool_)
+    price_return = np.zeros(n_windows, dtype=np.float64)
+    range_ratio = np.zeros(n_windows, dtype=np.float64)
+    vol = np.zeros(n_windows, dtype=np.float64)
+    los = np.searchsorted(open_time, starts, side="left")
+    his = np.searchsorted(open_time, starts + window_ms, side="left")
+    for w, (lo, hi) in enumerate(zip(los.tolist(), his.tolist())):
+        if hi - lo < min_candles:
+            continue
+        open_price = float(open_[lo])
+        close_price = float(close[hi - 1])
+        if open_price <= 0 or close_price <= 0:
+            continue
+
+        closes = close[lo:hi]
+        prev = closes[:-1]
+        positive = prev > 0
+        minute_returns = closes[1:][positive] / prev[positive] - 1.0
+
+        valid[w] = True
+        price_return[w] = close_price / open_price - 1.0
+        range_ratio[w] = (
+            float(high[lo:hi].max()) - float(low[lo:hi].min())
+        ) / open_price
+        vol[w] = float(minute_returns.std()) if minute_returns.size > 1 else 0.0
+    return valid, price_return, range_ratio, vol
 
 
 def compute_regime_rows(
-    pnl_windows: Sequence[PnLWindow],
-    candles: Sequence[Candle],
+    pnl_windows: PnLWindows,
+    candles: Candles,
     window_seconds: int,
     min_candles: int,
 ) -> Sequence[RegimeRow]:
     rows: List[RegimeRow] = []
     window_ms = window_seconds * 1000
     coalesced = coalesce_windows(pnl_windows, window_ms)
+    window_features = make_window_features(window_ms, min_candles)
+    valid, price_return, range_ratio, vol = window_features(
+        coalesced.bucket_start_ts,
+        candles.open_time,
+        candles.open,
+        candles.high,
+        candles.low,
+        candles.close,
+    )
 
-    for pnl in coalesced:
-        start_ms = pnl.bucket_start_ts
-        end_ms = start_ms + window_ms
-        bucket_candles = slice_candles(candles, start_ms, end_ms)
-        if len(bucket_candles) < min_candles:
-            continue
-
-        first = bucket_candles[0]
-        last = bucket_candles[-1]
-        open_price = first.open
-        close_price = last.close
-        if open_price <= 0 or close_price <= 0:
-            continue
-
-        price_return = (close_price / open_price) - 1.0
-        abs_return = abs(price_return)
-        high = max(c.high for c in bucket_candles)
-        low = min(c.low for c in bucket_candles)
-        range_ratio = (high - low) / open_price if open_price else 0.0
-
-        minute_returns: List[float] = []
-        prev_close = first.close
-        for candle in bucket_candles[1:]:
-            if prev_close > 0:
-                minute_returns.append((candle.close / prev_close) - 1.0)
-            prev_close = candle.close
-        vol = statistics.pstdev(minute_returns) if len(minute_returns) > 1 else 0.0
-
+    for idx in np.flatnonzero(valid).tolist():
+        pnl = PnLWindow(
+            bucket_start_ts=int(coalesced.bucket_start_ts[idx]),
+            window_seconds=int(coalesced.window_seconds[idx]),
+            realized_quote=float(coalesced.realized_quote[idx]),
+            maker_volume=float(coalesced.maker_volume[idx]),
+            base_delta=float(coalesced.base_delta[idx]),
+        )
         rows.append(
             RegimeRow(
                 pnl=pnl,
-                price_return=price_return,
-                abs_return=abs_return,
-                range_ratio=range_ratio,
-                vol=vol,
+                price_return=float(price_return[idx]),
+                abs_return=abs(float(price_return[idx])),
+                range_ratio=float(range_ratio[idx]),
+                vol=float(vol[idx]),
             )
         )
     return rows
 
 
 def pearson(xs: Iterable[float], ys: Iterable[float]) -> float:
-    xs_list = list(xs)
-    ys_list = list(ys)
-    if len(xs_list) != len(ys_list) or len(xs_list) == 0:
+    x = np.asarray(xs if isinstance(xs, np.ndarray) else list(xs), dtype=np.float64)
+    y = np.asarray(ys if isinstance(ys, np.ndarray) else list(ys), dtype=np.float64)
+    if x.shape != y.shape or x.size == 0:
         return math.nan
-    mean_x = statistics.fmean(xs_list)
-    mean_y = statistics.fmean(ys_list)
-    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs_list, ys_list))
-    den_x = math.sqrt(sum((x - mean_x) ** 2 for x in xs_list))
-    den_y = math.sqrt(sum((y - mean_y) ** 2 for y in ys_list))
-    if den_x == 0 or den_y == 0:
+    dx = x - x.mean()
+    dy = y - y.mean()
+    den = math.sqrt(float(dx @ dx) * float(dy @ dy))
+    if den == 0:
         return 0.0
-    return num / (den_x * den_y)
-
-
-def quantile_splits(values: Sequence[float], buckets: int) -> List[float]:
-    if not values:
-        return []
-    sorted_vals = sorted(values)
-    splits: List[float] = []
-    for i in range(1, buckets):
-        idx = int(len(sorted_vals) * i / buckets)
-        splits.append(sorted_vals[min(idx, len(sorted_vals) - 1)])
-    return splits
+    return float(dx @ dy) / den
 
 
-def bucketize(value: float, splits: Sequence[float]) -> int:
-    for i, split in enumerate(splits):
-        if value <= split:
-            return i
-    return len(splits)
+def quantile_splits(values: np.ndarray, buckets: int) -> np.ndarray:
+    """Order-statistic splits: the value at rank len*i//buckets for i in 1..buckets-1."""
+    count = len(values)
+    if count == 0:
+        return np.empty(0, dtype=np.float64)
+    ranks = np.minimum(np.arange(1, buckets) * count // buckets, count - 1)
+    return np.partition(values, ranks)[ranks]
 
 
 def summarize(rows: Sequence[RegimeRow]) -> None:
@@ -226,48 +341,71 @@ def summarize(rows: Sequence[RegimeRow]) -> None:
         print("No overlapping windows between PnL data and candles.")
         return
 
-    pnl_values = [row.pnl.realized_quote for row in rows]
+    # One pass over rows; each feature is a column view of the same array.
+    features = np.array(
+        [
+            (
+                row.pnl.realized_quote,
+                row.price_return,
+                row.abs_return,
+                row.range_ratio,
+                row.vol,
+                row.pnl.base_delta,
+            )
+            for row in rows
+        ],
+        dtype=np.float64,
+    )
+    pnl_arr, price_return, abs_return, range_ratio, vol_arr, base_delta = features.T
     print(f"Matched windows: {len(rows)}")
-    print(f"Avg realized PnL (quote): {statistics.fmean(pnl_values):.4f}")
-    print(f"Median realized PnL (quote): {statistics.median(pnl_values):.4f}")
+    print(f"Avg realized PnL (quote): {pnl_arr.mean():.4f}")
+    print(f"Median realized PnL (quote): {np.median(pnl_arr):.4f}")
 
     correlations = {
-        "price_return": pearson(pnl_values, [row.price_return for row in rows]),
-        "abs_return": pearson(pnl_values, [row.abs_return for row in rows]),
-        "range_ratio": pearson(pnl_values, [row.range_ratio for row in rows]),
-        "vol": pearson(pnl_values, [row.vol for row in rows]),
-        "base_delta": pearson(pnl_values, [row.pnl.base_delta for row in rows]),
+        "price_return": pearson(pnl_arr, price_return),
+        "abs_return": pearson(pnl_arr, abs_return),
+        "range_ratio": pearson(pnl_arr, range_ratio),
+        "vol": pearson(pnl_arr, vol_arr),
+        "base_delta": pearson(pnl_arr, base_delta),
     }
     print("Correlations (realized PnL vs feature):")
     for key, value in correlations.items():
         print(f"  {key:>12}: {value: .3f}")
 
-    def summarize_group(name: str, predicate) -> None:
-        group = [row.pnl.realized_quote for row in rows if predicate(row)]
-        if group:
-            print(f"{name:<24} count={len(group):4d} avg={statistics.fmean(group): .4f}")
-
-    summarize_group("Up trend (>0.1%)", lambda r: r.price_return > 0.001)
-    summarize_group("Down trend (<-0.1%)", lambda r: r.price_return < -0.001)
-    summarize_group("Flat trend", lambda r: abs(r.price_return) <= 0.001)
-
-    vol_values = [row.vol for row in rows]
-    splits = quantile_splits(vol_values, buckets=3)
-    buckets_summary = [[] for _ in range(len(splits) + 1)]
-    for row in rows:
-        idx = bucketize(row.vol, splits)
-        buckets_summary[idx].append(row.pnl.realized_quote)
-
-    for idx, group in enumerate(buckets_summary):
-        if not group:
+    # 0 = down, 1 = flat, 2 = up
+    trend = (
+        (price_return > 0.001).astype(np.int8)
+        - (price_return < -0.001).astype(np.int8)
+        + 1
+    )
+    trend_counts = np.bincount(trend, minlength=3)
+    trend_sums = np.bincount(trend, weights=pnl_arr, minlength=3)
+    for name, idx in (
+        ("Up trend (>0.1%)", 2),
+        ("Down trend (<-0.1%)", 0),
+        ("Flat trend", 1),
+    ):
+        count = int(trend_counts[idx])
+        if count:
+            print(f"{name:<24} count={count:4d} avg={trend_sums[idx] / count: .4f}")
+
+    splits = quantile_splits(vol_arr, buckets=3)
+    bucket_idx = np.digitize(vol_arr, splits, right=True)
+    n_buckets = len(splits) + 1
+    counts = np.bincount(bucket_idx, minlength=n_buckets)
+    sums = np.bincount(bucket_idx, weights=pnl_arr, minlength=n_buckets)
+
+    for idx in range(n_buckets):
+        count = int(counts[idx])
+        if not count:
             continue
         if idx == 0:
-            label = f"Low vol (≤ {splits[idx]:.4f})" if splits else "Low vol"
-        elif idx == len(buckets_summary) - 1:
+            label = f"Low vol (≤ {splits[idx]:.4f})" if len(splits) else "Low vol"
+        elif idx == n_buckets - 1:
             label = f"High vol (> {splits[idx-1]:.4f})"
         else:
             label = f"Mid vol (≤ {splits[idx]:.4f})"
-        print(f"{label:<24} count={len(group):4d} avg={statistics.fmean(group): .4f}")
+        print(f"{label:<24} count={count:4d} avg={sums[idx] / count: .4f}")
 
 
 def main() -> None:
@@ -1,10 +1,30 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 LOG_PATH = os.path.join("logs", "bot.log")
 os.makedirs("logs", exist_ok=True)
 
-_formatter = logging.Formatter(
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that only re-runs strftime when the wall-clock second changes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_str
+
+
+_formatter = _CachedTimeFormatter(
     fmt="%(asctime)s [%(levelname)s] %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
@@ -15,7 +35,12 @@ _handler.setFormatter(_formatter)
 _console = logging.StreamHandler()
 _console.setFormatter(_formatter)
 
+# Producers only enqueue; file/console I/O happens on the listener thread.
+_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener = QueueListener(_queue, _handler, _console, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
 logger = logging.getLogger("lighter")
 logger.setLevel(logging.INFO)
-logger.addHandler(_handler)
-logger.addHandler(_console)
+logger.addHandler(QueueHandler(_queue))
@@ -1,83 +1,23 @@
 # core/main.py
 import asyncio
-import inspect
+import copy
+import functools
+import hashlib
+import importlib
 import json
 import logging
 import os
 import signal
 import sys
 import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from decimal import Decimal
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
-import yaml
-
-# Optional imports (survive partial milestones)
-try:
-    from modules.funding_optimizer import FundingOptimizer
-except Exception:  # noqa
-    FundingOptimizer = None  # type: ignore
-
-try:
-    from modules.maker_engine import MakerEngine
-except Exception:  # noqa
-    MakerEngine = None  # type: ignore
-
-try:
-    from modules.market_data_listener import MarketDataListener
-except Exception:  # noqa
-    MarketDataListener = None  # type: ignore
-
-try:
-    from modules.mock_metrics import MockMetrics, MockMetricsProvider
-except Exception:  # noqa
-    MockMetrics = None  # type: ignore
-    MockMetricsProvider = None  # type: ignore
-
-try:
-    from core.state_store import StateStore
-except Exception:  # noqa
-    StateStore = None  # type: ignore
-
-try:
-    from core.message_router import MessageRouter
-except Exception:  # noqa
-    MessageRouter = None  # type: ignore
-
-try:
-    from scripts.replay_sim import ReplaySimulator
-except Exception:  # noqa
-    ReplaySimulator = None  # type: ignore
-
-try:
-    from modules.chaos_injector import ChaosInjector
-except Exception:  # noqa
-    ChaosInjector = None  # type: ignore
-
-try:
-    from modules.self_trade_guard import SelfTradeGuard
-except Exception:  # noqa
-    SelfTradeGuard = None  # type: ignore
-
-try:
-    from modules.account_listener import AccountListener
-except Exception:  # noqa
-    AccountListener = None  # type: ignore
-
-try:
-    from modules.mean_reversion_trader import MeanReversionTrader
-except Exception:  # noqa
-    MeanReversionTrader = None  # type: ignore
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from core.trading_client import TradingClient, TradingConfig
-
-try:
-    from modules.hedger import Hedger
-except Exception:  # noqa
-    Hedger = None  # type: ignore
-
 from modules.alert_manager import AlertManager
 from metrics import MetricsCompositor, MetricsLedger
 from modules.telemetry import Telemetry
@@ -96,21 +36,17 @@ except Exception:
             defaults: Dict[str, Any],
             aliases: Dict[str, str],
         ):
-            super().__init__(**base)
-            self.__dict__["_defaults"] = defaults
-            self.__dict__["_aliases"] = aliases
+            # Resolve defaults and aliases up front so reads are plain attribute hits.
+            resolved = {**defaults, **base}
+            for alias, target in aliases.items():
+                if alias not in resolved and target in resolved:
+                    resolved[alias] = resolved[target]
+            super().__init__(**resolved)
 
         def __getattr__(self, name: str) -> Any:
-            if name in self.__dict__:
-                return self.__dict__[name]
-            aliases = self.__dict__.get("_aliases", {})
-            if name in aliases:
-                return getattr(self, aliases[name])
-            defaults = self.__dict__.get("_defaults", {})
-            if name in defaults:
-                return defaults[name]
+            # Only reached for names absent from base, defaults and aliases.
             if not self._warned.get(name):
-                logging.getLogger("compat").warning(
+                COMPAT_LOG.warning(
                     "[compat] optimizer config missing '%s' — using neutral default.",
                     name,
                 )
@@ -118,13 +54,129 @@ except Exception:
             return 0.0  # neutral default
 
 
+# Optional components (survive partial milestones). Resolved on first use so
+# importing core.main does not pull in every module; see _optional().
+_OPTIONAL: Dict[str, str] = {
+    "FundingOptimizer": "modules.funding_optimizer",
+    "PairMetrics": "modules.funding_optimizer",
+    "MakerEngine": "modules.maker_engine",
+    "MarketDataListener": "modules.market_data_listener",
+    "MockMetrics": "modules.mock_metrics",
+    "MockMetricsProvider": "modules.mock_metrics",
+    "StateStore": "core.state_store",
+    "MessageRouter": "core.message_router",
+    "ReplaySimulator": "scripts.replay_sim",
+    "ChaosInjector": "modules.chaos_injector",
+    "SelfTradeGuard": "modules.self_trade_guard",
+    "AccountListener": "modules.account_listener",
+    "MeanReversionTrader": "modules.mean_reversion_trader",
+    "Hedger": "modules.hedger",
+}
+
+
+def _optional(name: str) -> Any:
+    """Import an optional component by name; None if its module fails to import."""
+    namespace = globals()
+    if name in namespace:
+        return namespace[name]
+    try:
+        value = getattr(importlib.import_module(_OPTIONAL[name]), name)
+    except Exception:  # noqa
+        value = None
+    namespace[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTIONAL:
+        return _optional(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if os.environ.get("LIGHTER_EAGER_IMPORT") == "1":
+    # CI: surface broken optional modules at import time.
+    for _name in _OPTIONAL:
+        _optional(_name)
+
 APP_NAME = "lighter-bot"
 
+MAIN_LOG = logging.getLogger("main")
+CONFIG_LOG = logging.getLogger("config")
+OPTIMIZER_LOG = logging.getLogger("optimizer")
+TRADING_LOG = logging.getLogger("trading")
+TELEMETRY_LOG = logging.getLogger("telemetry")
+COMPAT_LOG = logging.getLogger("compat")
+
+
+def _config_sidecar_path(cfg_path: str) -> str:
+    return f"{cfg_path}.cache.json"
+
+
+def _read_config_sidecar(
+    cfg_path: str, mtime_ns: int, size: int
+) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_config_sidecar_path(cfg_path), "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("mtime_ns") != mtime_ns or cached.get("size") != size:
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_config_sidecar(
+    cfg_path: str, mtime_ns: int, size: int, data: Dict[str, Any]
+) -> None:
+    try:
+        payload = json.dumps({"mtime_ns": mtime_ns, "size": size, "data": data})
+        # Only cache configs that survive a JSON round trip unchanged
+        # (e.g. no int keys or YAML dates).
+        if json.loads(payload)["data"] != data:
+            return
+        sidecar = _config_sidecar_path(cfg_path)
+        tmp = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(payload)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError) as exc:
+        CONFIG_LOG.debug("[config] sidecar cache not written: %s", exc)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(cfg_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size are part of the cache key so edits to the file invalidate it.
+    # LIGHTER_CONFIG_CACHE=1 also persists the parsed YAML (before env overrides)
+    # to <config>.cache.json so restarts can skip YAML parsing.
+    use_sidecar = os.environ.get("LIGHTER_CONFIG_CACHE") == "1"
+    if use_sidecar:
+        cached = _read_config_sidecar(cfg_path, mtime_ns, size)
+        if cached is not None:
+            return cached
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader  # type: ignore
+
+    # libyaml decodes bytes itself; skip the Python-side text decode.
+    with open(cfg_path, "rb") as f:
+        data = yaml.load(f.read(), Loader=loader) or {}
+    if use_sidecar:
+        _write_config_sidecar(cfg_path, mtime_ns, size, data)
+    return data
+
 
 def load_config() -> Dict[str, Any]:
     cfg_path = os.environ.get("LIGHTER_CONFIG", "config.yaml")
-    with open(cfg_path, "r") as f:
-        cfg = yaml.safe_load(f) or {}
+    st = os.stat(cfg_path)
+    parsed = _parse_config_file(cfg_path, st.st_mtime_ns, st.st_size)
+    # Callers mutate the returned dict, so never hand out the cached object.
+    cfg = copy.deepcopy(parsed)
     return _apply_env_overrides(cfg)
 
 
@@ -147,131 +199,221 @@ def setup_logging():
         logging.getLogger(name).setLevel(level)
 
 
-def _try_construct(cls, variants: List[Tuple[tuple, dict]]):
-    last_exc = None
-    for args, kwargs in variants:
-        try:
-            return cls(*args, **kwargs)
-        except TypeError as e:
-            last_exc = e
-            continue
-    if last_exc:
-        raise last_exc
-    return cls()  # pragma: no cover
+@functools.lru_cache(maxsize=None)
+def _ctor_spec(cls) -> Tuple[Optional[FrozenSet[str]], FrozenSet[str]]:
+    """
+    Keyword names cls's constructor accepts (None if it takes **kwargs) and
+    the names it requires. Introspected once per class.
+    """
+    import inspect
+
+    params = list(inspect.signature(cls).parameters.values())
+    named = [p for p in params if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)]
+    if any(p.kind is p.VAR_KEYWORD for p in params):
+        accepted = None
+    else:
+        accepted = frozenset(p.name for p in named)
+    required = frozenset(p.name for p in named if p.default is p.empty)
+    return accepted, required
+
+
+def _construct(cls, ctx: Dict[str, Any]):
+    """Instantiate cls with the subset of ctx its constructor accepts."""
+    accepted, required = _ctor_spec(cls)
+    kwargs = (
+        dict(ctx)
+        if accepted is None
+        else {k: v for k, v in ctx.items() if k in accepted}
+    )
+    missing = required.difference(kwargs)
+    if missing:
+        raise TypeError(
+            f"{cls.__name__}() needs unsupported arguments: {', '.join(sorted(missing))}"
+        )
+    return cls(**kwargs)
+
+
+_ENV_SPECS: Tuple[Tuple[Tuple[str, ...], str, str], ...] = (
+    (("app", "log_level"), "APP_LOG_LEVEL", "str"),
+    (("app", "name"), "APP_NAME", "str"),
+    (("ws", "url"), "WS_URL", "str"),
+    (("ws", "auth_token"), "WS_AUTH_TOKEN", "str"),
+    (("ws", "log_mid_interval_s"), "WS_LOG_MID_INTERVAL_S", "float"),
+    (("api", "base_url"), "API_BASE_URL", "str"),
+    (("api", "key"), "API_KEY_PRIVATE_KEY", "str"),
+    (("api", "account_index"), "ACCOUNT_INDEX", "int"),
+    (("api", "api_key_index"), "API_KEY_INDEX", "int"),
+    (("api", "max_api_key_index"), "MAX_API_KEY_INDEX", "int"),
+    (("api", "nonce_management"), "NONCE_MANAGEMENT", "str"),
+    # Trading parameters should ONLY come from config.yaml (version controlled)
+    # Removed env overrides for: MAKER_*, HEDGER_* (except enabled/dry_run/market)
+    # This prevents Railway variables from overriding config.yaml and causing confusion
+    (("maker", "dry_run"), "MAKER_DRY_RUN", "bool"),  # Keep: runtime safety toggle
+    (("hedger", "enabled"), "HEDGER_ENABLED", "bool"),  # Keep: runtime enable/disable
+    (("hedger", "dry_run"), "HEDGER_DRY_RUN", "bool"),  # Keep: runtime safety toggle
+    (("hedger", "market"), "HEDGER_MARKET", "str"),  # Keep: might vary by deployment
+    (("fees", "maker_actual_rate"), "FEES_MAKER_ACTUAL_RATE", "float"),
+    (("fees", "taker_actual_rate"), "FEES_TAKER_ACTUAL_RATE", "float"),
+    (("fees", "maker_premium_rate"), "FEES_MAKER_PREMIUM_RATE", "float"),
+    (("fees", "taker_premium_rate"), "FEES_TAKER_PREMIUM_RATE", "float"),
+    (("alerts", "enabled"), "ALERTS_ENABLED", "bool"),
+    (("alerts", "discord_webhook_url"), "DISCORD_WEBHOOK", "str"),
+    (("telemetry", "enabled"), "TELEMETRY_ENABLED", "bool"),
+    (("telemetry", "port"), "TELEMETRY_PORT", "int"),
+    (("watchdogs", "ws_stale_seconds"), "WATCHDOG_WS_STALE_SECONDS", "int"),
+    (("watchdogs", "quote_stale_seconds"), "WATCHDOG_QUOTE_STALE_SECONDS", "int"),
+    (("watchdogs", "reminder_every_seconds"), "WATCHDOG_REMINDER_EVERY_SECONDS", "int"),
+    # Guard trading parameters should ONLY come from config.yaml (version controlled)
+    # Removed env overrides for: GUARD_PRICE_BAND_BPS, GUARD_MAX_POSITION_UNITS, GUARD_MAX_INVENTORY_NOTIONAL
+    # Only keep runtime safety toggles that might need quick changes
+    (
+        ("guard", "crossed_book_protection"),
+        "GUARD_CROSSED_BOOK_PROTECTION",
+        "bool",
+    ),  # Keep: safety toggle
+    (
+        ("guard", "kill_on_crossed_book"),
+        "GUARD_KILL_ON_CROSSED_BOOK",
+        "bool",
+    ),  # Keep: kill-switch toggle
+    (
+        ("guard", "kill_on_inventory_breach"),
+        "GUARD_KILL_ON_INVENTORY_BREACH",
+        "bool",
+    ),  # Keep: kill-switch toggle
+    (
+        ("guard", "backoff_seconds_on_block"),
+        "GUARD_BACKOFF_SECONDS_ON_BLOCK",
+        "int",
+    ),  # Keep: might vary by deployment
+    (("replay", "enabled"), "REPLAY_ENABLED", "bool"),
+    (("chaos", "enabled"), "CHAOS_ENABLED", "bool"),
+    (("optimizer", "enabled"), "OPTIMIZER_ENABLED", "bool"),
+    (("optimizer", "top_n"), "OPTIMIZER_TOP_N", "int"),
+    (("optimizer", "scan_interval_s"), "OPTIMIZER_SCAN_INTERVAL_S", "int"),
+    (("optimizer", "min_dwell_s"), "OPTIMIZER_MIN_DWELL_S", "int"),
+    (("mean_reversion", "enabled"), "MEAN_REVERSION_ENABLED", "bool"),
+    (("mean_reversion", "dry_run"), "MEAN_REVERSION_DRY_RUN", "bool"),
+)
+_ENV_NAMES = frozenset(env_name for _, env_name, _ in _ENV_SPECS)
+
+
+def _group_env_specs(
+    specs: Sequence[Tuple[Tuple[str, ...], str, str]],
+) -> Dict[Tuple[str, ...], Tuple[Tuple[str, str, str], ...]]:
+    grouped: Dict[Tuple[str, ...], List[Tuple[str, str, str]]] = {}
+    for path, env_name, kind in specs:
+        grouped.setdefault(path[:-1], []).append((path[-1], env_name, kind))
+    return {parent: tuple(leaves) for parent, leaves in grouped.items()}
 
 
-CONFIG_LOG = logging.getLogger("config")
+# Specs keyed by parent path so each parent dict is resolved once per load.
+_ENV_SPECS_BY_PARENT = _group_env_specs(_ENV_SPECS)
 
 
 def _apply_env_overrides(cfg: Dict[str, Any]) -> Dict[str, Any]:
     """Overlay environment variable values onto the YAML config."""
-    specs: List[Tuple[Tuple[str, ...], str, str]] = [
-        (("app", "log_level"), "APP_LOG_LEVEL", "str"),
-        (("app", "name"), "APP_NAME", "str"),
-        (("ws", "url"), "WS_URL", "str"),
-        (("ws", "auth_token"), "WS_AUTH_TOKEN", "str"),
-        (("ws", "log_mid_interval_s"), "WS_LOG_MID_INTERVAL_S", "float"),
-        (("api", "base_url"), "API_BASE_URL", "str"),
-        (("api", "key"), "API_KEY_PRIVATE_KEY", "str"),
-        (("api", "account_index"), "ACCOUNT_INDEX", "int"),
-        (("api", "api_key_index"), "API_KEY_INDEX", "int"),
-        (("api", "max_api_key_index"), "MAX_API_KEY_INDEX", "int"),
-        (("api", "nonce_management"), "NONCE_MANAGEMENT", "str"),
-        # Trading parameters should ONLY come from config.yaml (version controlled)
-        # Removed env overrides for: MAKER_*, HEDGER_* (except enabled/dry_run/market)
-        # This prevents Railway variables from overriding config.yaml and causing confusion
-        (("maker", "dry_run"), "MAKER_DRY_RUN", "bool"),  # Keep: runtime safety toggle
-        (("hedger", "enabled"), "HEDGER_ENABLED", "bool"),  # Keep: runtime enable/disable
-        (("hedger", "dry_run"), "HEDGER_DRY_RUN", "bool"),  # Keep: runtime safety toggle
-        (("hedger", "market"), "HEDGER_MARKET", "str"),  # Keep: might vary by deployment
-        (("fees", "maker_actual_rate"), "FEES_MAKER_ACTUAL_RATE", "float"),
-        (("fees", "taker_actual_rate"), "FEES_TAKER_ACTUAL_RATE", "float"),
-        (("fees", "maker_premium_rate"), "FEES_MAKER_PREMIUM_RATE", "float"),
-        (("fees", "taker_premium_rate"), "FEES_TAKER_PREMIUM_RATE", "float"),
-        (("alerts", "enabled"), "ALERTS_ENABLED", "bool"),
-        (("alerts", "discord_webhook_url"), "DISCORD_WEBHOOK", "str"),
-        (("telemetry", "enabled"), "TELEMETRY_ENABLED", "bool"),
-        (("telemetry", "port"), "TELEMETRY_PORT", "int"),
-        (("watchdogs", "ws_stale_seconds"), "WATCHDOG_WS_STALE_SECONDS", "int"),
-        (("watchdogs", "quote_stale_seconds"), "WATCHDOG_QUOTE_STALE_SECONDS", "int"),
-        (("watchdogs", "reminder_every_seconds"), "WATCHDOG_REMINDER_EVERY_SECONDS", "int"),
-        # Guard trading parameters should ONLY come from config.yaml (version controlled)
-        # Removed env overrides for: GUARD_PRICE_BAND_BPS, GUARD_MAX_POSITION_UNITS, GUARD_MAX_INVENTORY_NOTIONAL
-        # Only keep runtime safety toggles that might need quick changes
-        (("guard", "crossed_book_protection"), "GUARD_CROSSED_BOOK_PROTECTION", "bool"),  # Keep: safety toggle
-        (("guard", "kill_on_crossed_book"), "GUARD_KILL_ON_CROSSED_BOOK", "bool"),  # Keep: kill-switch toggle
-        (("guard", "kill_on_inventory_breach"), "GUARD_KILL_ON_INVENTORY_BREACH", "bool"),  # Keep: kill-switch toggle
-        (("guard", "backoff_seconds_on_block"), "GUARD_BACKOFF_SECONDS_ON_BLOCK", "int"),  # Keep: might vary by deployment
-        (("replay", "enabled"), "REPLAY_ENABLED", "bool"),
-        (("chaos", "enabled"), "CHAOS_ENABLED", "bool"),
-        (("optimizer", "enabled"), "OPTIMIZER_ENABLED", "bool"),
-        (("optimizer", "top_n"), "OPTIMIZER_TOP_N", "int"),
-        (("optimizer", "scan_interval_s"), "OPTIMIZER_SCAN_INTERVAL_S", "int"),
-        (("optimizer", "min_dwell_s"), "OPTIMIZER_MIN_DWELL_S", "int"),
-        (("mean_reversion", "enabled"), "MEAN_REVERSION_ENABLED", "bool"),
-        (("mean_reversion", "dry_run"), "MEAN_REVERSION_DRY_RUN", "bool"),
-    ]
-
-    for path, env_name, kind in specs:
-        raw = os.environ.get(env_name)
-        if raw is None or raw == "":
-            continue
-        try:
-            coerced = _coerce_env_value(raw, kind)
-        except ValueError as exc:
-            CONFIG_LOG.warning(
-                "[config] unable to coerce %s for %s (%s): %s",
-                raw,
-                env_name,
-                "->".join(path),
-                exc,
-            )
-            continue
-        _set_nested(cfg, path, coerced)
+    env = os.environ
+    # Snapshot the non-empty values of the known variables once.
+    present = {
+        name: raw for name in _ENV_NAMES.intersection(env.keys()) if (raw := env[name])
+    }
+    if not present:
+        return cfg
+
+    for parent_path, leaves in _ENV_SPECS_BY_PARENT.items():
+        parent: Optional[Dict[str, Any]] = None
+        for key, env_name, kind in leaves:
+            raw = present.get(env_name)
+            if raw is None:
+                continue
+            try:
+                coerced = _coerce_env_value(raw, kind)
+            except ValueError as exc:
+                CONFIG_LOG.warning(
+                    "[config] unable to coerce %s for %s (%s): %s",
+                    raw,
+                    env_name,
+                    "->".join(parent_path + (key,)),
+                    exc,
+                )
+                continue
+            if parent is None:
+                parent = _nested_parent(cfg, parent_path)
+            parent[key] = coerced
 
     return cfg
 
 
-def _set_nested(cfg: Dict[str, Any], path: Tuple[str, ...], value: Any) -> None:
+def _nested_parent(cfg: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    """Return the dict at path, replacing missing or non-dict nodes with {}."""
     cur = cfg
-    for key in path[:-1]:
-        if key not in cur or not isinstance(cur[key], dict):
-            cur[key] = {}
-        cur = cur[key]
-    cur[path[-1]] = value
+    for key in path:
+        nxt = cur.get(key)
+        if not isinstance(nxt, dict):
+            nxt = cur[key] = {}
+        cur = nxt
+    return cur
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_FALSY = frozenset({"0", "false", "no", "off"})
+
+
+def _coerce_bool(raw: str) -> bool:
+    lowered = raw.strip().lower()
+    if lowered in _TRUTHY:
+        return True
+    if lowered in _FALSY:
+        return False
+    raise ValueError("expected boolean value")
+
+
+_COERCERS = {"str": str, "int": int, "float": float, "bool": _coerce_bool}
 
 
 def _coerce_env_value(raw: str, kind: str) -> Any:
-    if kind == "str":
-        return raw
-    if kind == "int":
-        return int(raw)
-    if kind == "float":
-        return float(raw)
-    if kind == "bool":
-        lowered = raw.strip().lower()
-        if lowered in {"1", "true", "yes", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "off"}:
-            return False
-        raise ValueError("expected boolean value")
-    return raw
+    coerce = _COERCERS.get(kind)
+    return coerce(raw) if coerce is not None else raw
 
 
 class _FallbackMetrics:
     def __init__(self, markets: Optional[List[str]] = None):
         self.markets = markets or ["market:1", "market:2", "market:55", "market:99"]
+        self._n = len(self.markets)
+        # markets rotated left by i, one entry per 15s rotation slot
+        self._rotations = tuple(
+            tuple(self.markets[i:] + self.markets[:i]) for i in range(self._n)
+        )
 
     async def best_pairs(self, top_n: int = 2) -> List[str]:
-        idx = int(time.time() // 15) % len(self.markets)
-        ordered = self.markets[idx:] + self.markets[:idx]
-        return ordered[: max(1, top_n)]
+        n = self._n
+        rotation = self._rotations[int(time.time() // 15) % n]
+        return list(rotation[: min(max(1, top_n), n)])
 
 
 def _apr_to_8h(apr: float) -> float:
     return apr / 1095.0
 
 
+_MISSING = object()
+
+
+def _dict_get_any(obj: Dict[str, Any], *names: str, default: Any = None) -> Any:
+    for n in names:
+        if n in obj:
+            return obj[n]
+    return default
+
+
+def _attr_get_any(obj: Any, *names: str, default: Any = None) -> Any:
+    for n in names:
+        value = getattr(obj, n, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
 class _DSAdapter:
     """
     Normalizes any data source to what FundingOptimizer expects:
@@ -281,26 +423,43 @@ class _DSAdapter:
 
     def __init__(self, source: Any, markets: Optional[List[str]] = None):
         self._src = source
-        self._all_markets = markets or [
-            "market:1",
-            "market:2",
-            "market:55",
-            "market:99",
-        ]
-        self.LOG = logging.getLogger("optimizer")
-
-    def _coerce_one(self, m: Any) -> Optional[SimpleNamespace]:
+        # Resolve the optional source methods once instead of probing per scan.
+        self._src_fetch = getattr(source, "fetch_pair_metrics", None)
+        self._src_best = getattr(source, "best_pairs", None)
+        # Same attribute surface either way; the optimizer module is optional.
+        self._metrics_cls = _optional("PairMetrics") or SimpleNamespace
+        self._all_markets: Tuple[str, ...] = tuple(
+            markets or ("market:1", "market:2", "market:55", "market:99")
+        )
+        self._n_markets = len(self._all_markets)
+        # Per-market APR skew used by the fabricated fallback metrics.
+        self._apr_skew = tuple(0.001 * i for i in range(self._n_markets))
+        # Default top pair per 15s rotation slot when the source has no best_pairs.
+        n = self._n_markets
+        self._rotation = tuple(
+            (self._all_markets[i], self._all_markets[(i + 1) % n]) for i in range(n)
+        )
+        # Fabricated metrics are refreshed in place each scan; the optimizer
+        # only keeps the latest set, so nothing holds on to stale values.
+        self._fallback_ns = tuple(
+            SimpleNamespace(
+                market_id=m,
+                symbol=None,
+                funding_1h=0.0,
+                funding_8h=0.0,
+                funding_24h=0.0,
+                open_interest=0.0,
+                spread_bps=12.0,
+            )
+            for m in self._all_markets
+        )
+        self.LOG = OPTIMIZER_LOG
+
+    def _coerce_one(self, m: Any) -> Optional[Any]:
         if m is None:
             return None
 
-        def get(obj, *names, default=None):
-            for n in names:
-                if isinstance(obj, dict) and n in obj:
-                    return obj[n]
-                if hasattr(obj, n):
-                    return getattr(obj, n)
-            return default
-
+        get = _dict_get_any if isinstance(m, dict) else _attr_get_any
         market_id = get(m, "market_id", "market", "id")
         if not market_id or not isinstance(market_id, str):
             return None
@@ -327,7 +486,7 @@ class _DSAdapter:
         spread_bps = get(m, "spread_bps", "spreadBps", default=12.0)
         symbol = get(m, "symbol")
 
-        return SimpleNamespace(
+        return self._metrics_cls(
             market_id=str(market_id),
             symbol=symbol if isinstance(symbol, str) else None,
             funding_1h=float(funding_1h) if funding_1h is not None else None,
@@ -337,59 +496,50 @@ class _DSAdapter:
             spread_bps=float(spread_bps) if spread_bps is not None else None,
         )
 
-    async def fetch_pair_metrics(self) -> List[SimpleNamespace]:
+    async def fetch_pair_metrics(self) -> List[Any]:
         # passthrough if provider already exposes the right call
-        if hasattr(self._src, "fetch_pair_metrics"):
-            fn = getattr(self._src, "fetch_pair_metrics")
+        if self._src_fetch is not None:
             try:
-                out = fn()
+                out = self._src_fetch()
                 if asyncio.iscoroutine(out):
                     out = await out
                 if isinstance(out, list):
-                    coerced = [self._coerce_one(x) for x in out]
-                    return [c for c in coerced if c is not None]
+                    coerce = self._coerce_one
+                    return [c for x in out if (c := coerce(x)) is not None]
             except Exception as e:
-                self.LOG.debug("[ds] passthrough fetch_pair_metrics failed: %s", e)
+                if self.LOG.isEnabledFor(logging.DEBUG):
+                    self.LOG.debug("[ds] passthrough fetch_pair_metrics failed: %s", e)
 
         # otherwise fabricate plausible metrics favoring a rotating subset
         top: List[str] = []
-        if hasattr(self._src, "best_pairs"):
+        if self._src_best is not None:
             try:
-                res = self._src.best_pairs(top_n=3)
+                res = self._src_best(top_n=3)
                 if asyncio.iscoroutine(res):
                     res = await res
                 if isinstance(res, list):
                     top = [str(x) for x in res]
             except Exception as e:
-                self.LOG.debug("[ds] best_pairs() failed: %s", e)
+                if self.LOG.isEnabledFor(logging.DEBUG):
+                    self.LOG.debug("[ds] best_pairs() failed: %s", e)
 
         if not top:
-            idx = int(time.time() // 15) % len(self._all_markets)
-            top = [
-                self._all_markets[idx],
-                self._all_markets[(idx + 1) % len(self._all_markets)],
-            ]
+            top = self._rotation[int(time.time() // 15) % self._n_markets]
+        top_set = frozenset(top)
 
         now = int(time.time())
         wob = ((now // 5) % 10) / 100.0
-        out: List[SimpleNamespace] = []
-        for i, m in enumerate(self._all_markets):
-            is_top = m in top
-            base_apr = 0.02 if is_top else -0.005
-            apr = base_apr + wob - (0.001 * i)
-            f8 = _apr_to_8h(apr)
-            out.append(
-                SimpleNamespace(
-                    market_id=m,
-                    symbol=None,
-                    funding_1h=f8 / 8.0,
-                    funding_8h=f8,
-                    funding_24h=f8 * 3.0,
-                    open_interest=1_000_000.0 if is_top else 250_000.0,
-                    spread_bps=8.0 if is_top else 12.0,
-                )
-            )
-        return out
+        top_apr = 0.02 + wob
+        other_apr = -0.005 + wob
+        for ns, skew in zip(self._fallback_ns, self._apr_skew):
+            is_top = ns.market_id in top_set
+            f8 = _apr_to_8h((top_apr if is_top else other_apr) - skew)
+            ns.funding_1h = f8 / 8.0
+            ns.funding_8h = f8
+            ns.funding_24h = f8 * 3.0
+            ns.open_interest = 1_000_000.0 if is_top else 250_000.0
+            ns.spread_bps = 8.0 if is_top else 12.0
+        return list(self._fallback_ns)
 
 
 class _MakerUpdater:
@@ -405,10 +555,10 @@ class _MakerUpdater:
                 list(market_ids),
             )
             return
-        if not market_ids:
+        primary = next(iter(market_ids), None)
+        if primary is None:
             self.LOG.info("[updater] empty pair set; ignoring")
             return
-        primary = list(market_ids)[0]
         try:
             prev = getattr(self.maker, "market", None)
             setattr(self.maker, "market", primary)
@@ -426,115 +576,198 @@ class _StateAdapter:
 
     def __init__(self, state: Any):
         self._state = state
-        self._LOG = logging.getLogger("optimizer")
+        self._LOG = OPTIMIZER_LOG
+        # Resolve the optional StateStore methods once instead of probing per call.
+        self._set_active = getattr(state, "set_active_pairs", None)
+        self._get_active = getattr(state, "get_active_pairs", None)
+        self._set_metrics = getattr(state, "set_pair_metrics", None)
+        self._now = getattr(state, "now", None)
 
     # optimizer expects these names:
     def set_active_pairs(self, pairs: Sequence[str]) -> None:
-        if hasattr(self._state, "set_active_pairs"):
+        if self._set_active is not None:
             try:
-                self._state.set_active_pairs(list(pairs))
+                self._set_active(list(pairs))
                 return
             except Exception:
-                pass
+                if self._LOG.isEnabledFor(logging.DEBUG):
+                    self._LOG.debug(
+                        "[state] set_active_pairs failed; using fallback", exc_info=True
+                    )
         # Soft fallback: store on self for visibility
         setattr(self._state, "_active_pairs", list(pairs))
 
     def get_active_pairs(self) -> List[str]:
-        if hasattr(self._state, "get_active_pairs"):
+        if self._get_active is not None:
             try:
-                return list(self._state.get_active_pairs())
+                return list(self._get_active())
             except Exception:
-                pass
+                if self._LOG.isEnabledFor(logging.DEBUG):
+                    self._LOG.debug(
+                        "[state] get_active_pairs failed; using fallback", exc_info=True
+                    )
         return list(getattr(self._state, "_active_pairs", []))
 
     def set_pair_metrics(self, metrics: Dict[str, Any]) -> None:
-        if hasattr(self._state, "set_pair_metrics"):
+        if self._set_metrics is not None:
             try:
-                self._state.set_pair_metrics(metrics)
+                self._set_metrics(metrics)
                 return
             except Exception:
-                pass
+                if self._LOG.isEnabledFor(logging.DEBUG):
+                    self._LOG.debug(
+                        "[state] set_pair_metrics failed; using fallback", exc_info=True
+                    )
         setattr(self._state, "_pair_metrics", metrics)
 
     def now(self) -> float:
-        if hasattr(self._state, "now"):
+        if self._now is not None:
             try:
-                return float(self._state.now())
+                return float(self._now())
             except Exception:
-                pass
+                if self._LOG.isEnabledFor(logging.DEBUG):
+                    self._LOG.debug("[state] now failed; using fallback", exc_info=True)
         return time.time()
 
 
+_OPT_CFG_CACHE: "OrderedDict[bytes, ConfigCompat]" = OrderedDict()
+_OPT_CFG_CACHE_SIZE = 8
+
+
 def _opt_cfg_from_dict(root_cfg: Dict[str, Any]) -> ConfigCompat:
     """
     Build attribute-style optimizer config matching your OptimizerConfig dataclass.
     Also supports common aliases used in earlier iterations.
+
+    Results are memoized on a hash of the optimizer block, so reloading an
+    unchanged config returns the same (read-only) object.
     """
     src = (
         (root_cfg.get("optimizer") or {})
         if isinstance(root_cfg.get("optimizer"), dict)
         else {}
     )
-
-    # Defaults copied from modules/funding_optimizer.py::OptimizerConfig
-    defaults: Dict[str, Any] = {
-        "enabled": True,
-        "scan_interval_s": 30,
-        "top_n": 3,
-        "min_open_interest": 0.0,
-        "max_spread_bps": 25.0,
-        "w_funding": 1.0,
-        "w_oi": 0.2,
-        "spread_bps_penalty": 0.02,
-        "min_dwell_s": 120,
-        "hysteresis_score_margin": 0.05,
-        "max_switches_per_hour": 12,
-    }
-
+    key = hashlib.blake2b(
+        json.dumps(src, sort_keys=True, default=str).encode(), digest_size=8
+    ).digest()
+    cached = _OPT_CFG_CACHE.get(key)
+    if cached is not None:
+        _OPT_CFG_CACHE.move_to_end(key)
+        return cached
+    opt_cfg = _build_opt_cfg(src)
+    _OPT_CFG_CACHE[key] = opt_cfg
+    if len(_OPT_CFG_CACHE) > _OPT_CFG_CACHE_SIZE:
+        _OPT_CFG_CACHE.popitem(last=False)
+    return opt_cfg
+
+
+# Defaults copied from modules/funding_optimizer.py::OptimizerConfig
+_OPT_DEFAULTS: Dict[str, Any] = {
+    "enabled": True,
+    "scan_interval_s": 30,
+    "top_n": 3,
+    "min_open_interest": 0.0,
+    "max_spread_bps": 25.0,
+    "w_funding": 1.0,
+    "w_oi": 0.2,
+    "spread_bps_penalty": 0.02,
+    "min_dwell_s": 120,
+    "hysteresis_score_margin": 0.05,
+    "max_switches_per_hour": 12,
+}
+
+# aliases supported
+_OPT_ALIASES: Dict[str, str] = {
+    # weight/penalty aliases
+    "apr_weight": "w_funding",
+    "oi_weight": "w_oi",
+    "w_spread_penalty": "spread_bps_penalty",
+    # thresholds/stability aliases
+    "min_oi": "min_open_interest",
+    "dwell_seconds": "min_dwell_s",
+    "switches_per_hour": "max_switches_per_hour",
+    # historical alias we used earlier
+    "hysteresis": "hysteresis_score_margin",
+}
+
+# numeric coercions; every key here has a default to fall back to
+_OPT_COERCE: Dict[str, Any] = {
+    **dict.fromkeys(
+        ("scan_interval_s", "top_n", "min_dwell_s", "max_switches_per_hour"), int
+    ),
+    **dict.fromkeys(
+        (
+            "min_open_interest",
+            "max_spread_bps",
+            "w_funding",
+            "w_oi",
+            "spread_bps_penalty",
+            "hysteresis_score_margin",
+        ),
+        float,
+    ),
+}
+
+
+def _build_opt_cfg(src: Dict[str, Any]) -> ConfigCompat:
     # merge user overrides
-    merged = {**defaults, **src}
-
-    # aliases supported
-    aliases = {
-        # weight/penalty aliases
-        "apr_weight": "w_funding",
-        "oi_weight": "w_oi",
-        "w_spread_penalty": "spread_bps_penalty",
-        # thresholds/stability aliases
-        "min_oi": "min_open_interest",
-        "dwell_seconds": "min_dwell_s",
-        "switches_per_hour": "max_switches_per_hour",
-        # historical alias we used earlier
-        "hysteresis": "hysteresis_score_margin",
-    }
+    merged = {**_OPT_DEFAULTS, **src}
 
     # coerce numeric types where relevant
-    ints = {"scan_interval_s", "top_n", "min_dwell_s", "max_switches_per_hour"}
-    floats = {
-        "min_open_interest",
-        "max_spread_bps",
-        "w_funding",
-        "w_oi",
-        "spread_bps_penalty",
-        "hysteresis_score_margin",
-    }
-    for k in list(merged.keys()):
+    for k, coerce in _OPT_COERCE.items():
         try:
-            if k in ints:
-                merged[k] = int(merged[k])
-            elif k in floats:
-                merged[k] = float(merged[k])
+            merged[k] = coerce(merged[k])
         except Exception:
-            merged[k] = defaults.get(k, merged[k])
+            merged[k] = _OPT_DEFAULTS[k]
 
-    return ConfigCompat(merged, defaults, aliases)
+    return ConfigCompat(merged, _OPT_DEFAULTS, _OPT_ALIASES)
 
 
-def fire_and_forget(coro):  # type: ignore
-    try:
-        asyncio.create_task(coro)
-    except RuntimeError:
-        pass
+@functools.lru_cache(maxsize=32)
+def _component_entrypoint(cls) -> str:
+    """
+    How run_component starts instances of cls: "run" (async run), "start_async",
+    "start" (sync start) or "" (self-managed). Decided once per class.
+    """
+    if asyncio.iscoroutinefunction(getattr(cls, "run", None)):
+        return "run"
+    start = getattr(cls, "start", None)
+    if asyncio.iscoroutinefunction(start):
+        return "start_async"
+    if callable(start):
+        return "start"
+    return ""
+
+
+def _collect_changed(
+    values: Dict[str, Any],
+    prev: Dict[str, Any],
+    names: Dict[str, str],
+    prefix: str,
+    updates: Dict[str, float],
+) -> None:
+    """
+    Single pass over values: add each gauge whose value differs from prev
+    to updates (named prefix + key, cached in names) and record it in prev.
+    """
+    for key, value in values.items():
+        if prev.get(key) != value:
+            gauge = names.get(key)
+            if gauge is None:
+                gauge = names[key] = prefix + key
+            updates[gauge] = value if type(value) is float else float(value)
+            prev[key] = value
+
+
+@functools.lru_cache(maxsize=64)
+def _decimal_from_str(text: str) -> Decimal:
+    return Decimal(text)
+
+
+def _scale_to_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return _decimal_from_str(str(value))
 
 
 def _build_trading_config(
@@ -550,8 +783,8 @@ def _build_trading_config(
         return None
 
     maker_cfg = maker_cfg or {}
-    base_scale = Decimal(str(maker_cfg.get("size_scale", 1)))
-    price_scale = Decimal(str(maker_cfg.get("price_scale", 1)))
+    base_scale = _scale_to_decimal(maker_cfg.get("size_scale", 1))
+    price_scale = _scale_to_decimal(maker_cfg.get("price_scale", 1))
 
     try:
         return TradingConfig(
@@ -569,11 +802,21 @@ def _build_trading_config(
             nonce_management=api_cfg.get("nonce_management"),
         )
     except Exception as exc:
-        logging.getLogger("trading").warning("[main] invalid trading config: %s", exc)
+        TRADING_LOG.warning("[main] invalid trading config: %s", exc)
         return None
 
 
 async def main():
+    # Config-gated components (listener/replay, hedger, account listener,
+    # mean reversion) are resolved below only when enabled.
+    FundingOptimizer = _optional("FundingOptimizer")
+    MakerEngine = _optional("MakerEngine")
+    MockMetrics = _optional("MockMetrics")
+    MockMetricsProvider = _optional("MockMetricsProvider")
+    StateStore = _optional("StateStore")
+    ChaosInjector = _optional("ChaosInjector")
+    SelfTradeGuard = _optional("SelfTradeGuard")
+
     setup_logging()
     cfg = load_config()
     app = (cfg.get("app") or {}).get("name", APP_NAME)
@@ -593,26 +836,61 @@ async def main():
     )
     telemetry.start()
 
+    loop = asyncio.get_running_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        # Python 3.12+: the component and background-loop launches below
+        # (and the listener's hedger fill hand-off) run up to their first
+        # await inside create_task instead of waiting a loop turn. Alerts go
+        # through the alert_worker queue and do not spawn tasks.
+        loop.set_task_factory(eager_task_factory)
+
     start_ts = time.time()
+    start_mono = time.monotonic()
     telemetry.set_gauge("app_start_ts", start_ts)
-    fire_and_forget(
-        alert_mgr.info("Startup", f"{app} starting (M7 Telemetry & Alerts).")
+    # Computed at scrape time instead of being pushed every metrics tick.
+    telemetry.register_gauge_callback(
+        "uptime_seconds", lambda: time.monotonic() - start_mono
     )
 
-    loop = asyncio.get_running_loop()
+    # Alerts are sent in order by one worker task rather than a task per
+    # alert, so an exception or watchdog storm cannot flood the loop;
+    # overflow is dropped.
+    alert_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+    def queue_alert(
+        send: Callable[..., Any],
+        title: str,
+        message: str = "",
+        fields: Optional[Dict[str, Any]] = None,
+    ):
+        try:
+            alert_queue.put_nowait((send, title, message, fields))
+        except asyncio.QueueFull:
+            MAIN_LOG.warning("[main] alert queue full; dropping '%s'", title)
+
+    async def alert_worker():
+        while True:
+            send, title, message, fields = await alert_queue.get()
+            try:
+                await send(title, message=message, fields=fields)
+            except Exception as exc:
+                MAIN_LOG.warning("[main] alert '%s' failed: %s", title, exc)
+            finally:
+                alert_queue.task_done()
+
+    alert_task = loop.create_task(alert_worker(), name="alerts")
+    queue_alert(alert_mgr.info, "Startup", f"{app} starting (M7 Telemetry & Alerts).")
 
     def handle_exception(loop, context):
         msg = context.get("message")
         exc = context.get("exception")
         loop.default_exception_handler(context)
-        fire_and_forget(
-            alert_mgr.error(
-                "Unhandled exception",
-                message=str(msg) if msg else repr(exc),
-                fields=(
-                    {"type": type(exc).__name__ if exc else "unknown"} if exc else None
-                ),
-            )
+        queue_alert(
+            alert_mgr.error,
+            "Unhandled exception",
+            str(msg) if msg else repr(exc),
+            {"type": type(exc).__name__ if exc else "unknown"} if exc else None,
         )
 
     loop.set_exception_handler(handle_exception)
@@ -658,10 +936,10 @@ async def main():
     if trading_cfg:
         try:
             shared_trading_client = TradingClient(trading_cfg)
-            logging.getLogger("main").info("[main] shared trading client initialized")
+            MAIN_LOG.info("[main] shared trading client initialized")
         except Exception as exc:
             shared_trading_client = None
-            logging.getLogger("main").warning("[main] shared trading client unavailable: %s", exc)
+            MAIN_LOG.warning("[main] shared trading client unavailable: %s", exc)
 
     state_adapter = _StateAdapter(state)
 
@@ -671,11 +949,9 @@ async def main():
         try:
             chaos = ChaosInjector(cfg)
             if chaos.enabled:
-                logging.getLogger("main").info("[main] CHAOS INJECTOR enabled")
+                MAIN_LOG.info("[main] CHAOS INJECTOR enabled")
         except Exception as e:
-            logging.getLogger("main").warning(
-                "[main] failed to initialize chaos injector: %s", e
-            )
+            MAIN_LOG.warning("[main] failed to initialize chaos injector: %s", e)
 
     # --- Replay mode (M8) ---
     replay_cfg = cfg.get("replay") or {}
@@ -683,8 +959,10 @@ async def main():
     replay_sim = None
 
     if replay_enabled:
+        ReplaySimulator = _optional("ReplaySimulator")
+        MessageRouter = _optional("MessageRouter")
         if not ReplaySimulator or not MessageRouter:
-            logging.getLogger("main").error(
+            MAIN_LOG.error(
                 "[main] replay enabled but ReplaySimulator/MessageRouter not available"
             )
             sys.exit(1)
@@ -707,7 +985,7 @@ async def main():
             chaos_injector=chaos,
         )
 
-        logging.getLogger("main").info(
+        MAIN_LOG.info(
             "[main] REPLAY MODE enabled: path=%s speed=%.2fx filter=%s",
             replay_path,
             replay_speed,
@@ -717,24 +995,17 @@ async def main():
         listener = None
     else:
         listener = None
+        MarketDataListener = _optional("MarketDataListener")
         if MarketDataListener:
-            listener = _try_construct(
+            listener = _construct(
                 MarketDataListener,
-            [
-                (
-                    (),
-                    {
-                        "config": cfg,
-                        "state": state,
-                        "alert_manager": alert_mgr,
-                        "telemetry": telemetry,
-                    },
-                ),
-                ((), {"config": cfg, "state": state}),
-                ((cfg, state), {}),
-                ((cfg,), {}),
-            ],
-        )
+                {
+                    "config": cfg,
+                    "state": state,
+                    "alert_manager": alert_mgr,
+                    "telemetry": telemetry,
+                },
+            )
 
     # SelfTradeGuard (critical safety feature)
     self_trade_guard = None
@@ -742,42 +1013,33 @@ async def main():
         guard_cfg = (cfg.get("guard") or {}) if isinstance(cfg.get("guard"), dict) else {}
         try:
             self_trade_guard = SelfTradeGuard(state=state, cfg=guard_cfg)
-            logging.getLogger("main").info("[main] SelfTradeGuard initialized")
+            MAIN_LOG.info("[main] SelfTradeGuard initialized")
         except Exception as e:
-            logging.getLogger("main").warning(f"[main] SelfTradeGuard init failed: {e}")
+            MAIN_LOG.warning(f"[main] SelfTradeGuard init failed: {e}")
 
     maker = None
     if MakerEngine:
-        maker = _try_construct(
+        maker = _construct(
             MakerEngine,
-            [
-                (
-                    (),
-                    {
-                        "config": cfg,
-                        "state": state,
-                        "alert_manager": alert_mgr,
-                        "telemetry": telemetry,
-                        "chaos_injector": chaos,
-                        "guard": self_trade_guard,
-                        "trading_client": shared_trading_client,
-                    },
-                ),
-                ((), {"config": cfg, "state": state}),
-                ((cfg, state), {}),
-                ((state, cfg), {}),
-                ((state,), {}),
-                ((), {}),
-            ],
+            {
+                "config": cfg,
+                "state": state,
+                "alert_manager": alert_mgr,
+                "telemetry": telemetry,
+                "chaos_injector": chaos,
+                "guard": self_trade_guard,
+                "trading_client": shared_trading_client,
+            },
         )
 
     pnl_guard_cfg = (maker_cfg.get("pnl_guard") or {}) if isinstance(maker_cfg, dict) else {}
     pnl_guard_enabled = bool(pnl_guard_cfg.get("enabled", False))
 
     hedger = None
-    if Hedger:
-        hedger_cfg = cfg.get("hedger") or {}
-        if bool(hedger_cfg.get("enabled", False)):
+    hedger_cfg = cfg.get("hedger") or {}
+    if bool(hedger_cfg.get("enabled", False)):
+        Hedger = _optional("Hedger")
+        if Hedger:
             try:
                 hedger = Hedger(
                     config=cfg,
@@ -786,15 +1048,15 @@ async def main():
                     alert_manager=alert_mgr,
                     trading_client=shared_trading_client,
                 )
-                logging.getLogger("main").info("[main] Hedger initialized")
+                MAIN_LOG.info("[main] Hedger initialized")
             except Exception as exc:
-                logging.getLogger("main").warning("[main] Hedger init failed: %s", exc)
+                MAIN_LOG.warning("[main] Hedger init failed: %s", exc)
 
     account_listener = None
-    if AccountListener:
-        acct_cfg = cfg.get("account_listener") or {}
-        enabled = bool(acct_cfg.get("enabled", True))
-        if enabled:
+    acct_cfg = cfg.get("account_listener") or {}
+    if bool(acct_cfg.get("enabled", True)):
+        AccountListener = _optional("AccountListener")
+        if AccountListener:
             merged_cfg = dict(acct_cfg)
             merged_cfg.setdefault("api", cfg.get("api") or {})
             merged_cfg.setdefault("ws", cfg.get("ws") or {})
@@ -806,11 +1068,9 @@ async def main():
                     telemetry=telemetry,
                     metrics_ledger=metrics_ledger,
                 )
-                logging.getLogger("main").info("[main] AccountListener initialized")
+                MAIN_LOG.info("[main] AccountListener initialized")
             except Exception as exc:
-                logging.getLogger("main").warning(
-                    "[main] AccountListener init failed: %s", exc
-                )
+                MAIN_LOG.warning("[main] AccountListener init failed: %s", exc)
 
     # Data source -> adapter
     raw_ds = None
@@ -832,116 +1092,104 @@ async def main():
     opt_cfg_ns = None
     if FundingOptimizer:
         opt_cfg_ns = _opt_cfg_from_dict(cfg)
-        maker_updater = _MakerUpdater(maker, logging.getLogger("optimizer"))
+        maker_updater = _MakerUpdater(maker, OPTIMIZER_LOG)
 
         if getattr(opt_cfg_ns, "enabled", True) is False:
-            logging.getLogger("optimizer").info("[optimizer] disabled via config")
+            OPTIMIZER_LOG.info("[optimizer] disabled via config")
             opt_cfg_ns = None
 
     if FundingOptimizer and opt_cfg_ns is not None:
-
-        # Prefer the (data_source, state, maker_updater, cfg) signature
-        sig = None
-        try:
-            sig = inspect.signature(FundingOptimizer)
-        except Exception:
-            sig = None
-
-        if sig and len(sig.parameters) >= 4:
-            try:
-                optimizer = FundingOptimizer(data_source, state_adapter, maker_updater, opt_cfg_ns)  # type: ignore
-            except TypeError:
-                optimizer = _try_construct(
-                    FundingOptimizer,
-                    [
-                        (
-                            (),
-                            {
-                                "config": cfg,
-                                "state": state,
-                                "alert_manager": alert_mgr,
-                                "telemetry": telemetry,
-                            },
-                        ),
-                        ((), {"config": cfg, "state": state}),
-                        ((cfg, state), {}),
-                        ((state, cfg), {}),
-                        ((state,), {}),
-                        ((), {}),
-                    ],
-                )
-        else:
-            optimizer = _try_construct(
-                FundingOptimizer,
-                [
-                    (
-                        (),
-                        {
-                            "config": cfg,
-                            "state": state,
-                            "alert_manager": alert_mgr,
-                            "telemetry": telemetry,
-                        },
-                    ),
-                    ((), {"config": cfg, "state": state}),
-                    ((cfg, state), {}),
-                    ((state, cfg), {}),
-                    ((state,), {}),
-                    ((), {}),
-                ],
-            )
+        optimizer = _construct(
+            FundingOptimizer,
+            {
+                "data_source": data_source,
+                "state": state_adapter,
+                "maker_updater": maker_updater,
+                "cfg": opt_cfg_ns,
+                # names used by earlier optimizer constructors
+                "config": cfg,
+                "alert_manager": alert_mgr,
+                "telemetry": telemetry,
+            },
+        )
 
     # PairSelector removed - module not used
 
     tasks: List[asyncio.Task] = []
 
-    async def periodic_core_metrics():
-        rolling_seconds = int(metrics_cfg.get("rolling_window_seconds", 6 * 3600))
+    # --- Core metrics (published from the periodic task below) ---
+    rolling_seconds = int(metrics_cfg.get("rolling_window_seconds", 6 * 3600))
+    rolling_prefix = f"rolling_{int(rolling_seconds // 3600)}h_"
+
+    # Resolve state/telemetry methods once instead of per tick.
+    set_gauges = telemetry.set_gauges
+    get_fee_stats = getattr(state, "get_fee_stats", None) if state else None
+    get_inventory = getattr(state, "get_inventory", None) if state else None
+    get_mid = getattr(state, "get_mid", None) if state else None
+    if get_mid is None:
+        get_inventory = None
+    # Last published values; gauges persist in telemetry, so unchanged
+    # values are not re-sent.
+    prev_fee: Dict[str, Any] = {}
+    prev_metrics: Dict[str, Any] = {}
+    # Stats keys are a fixed schema, so each gauge name is formatted once.
+    fee_gauge_names: Dict[str, str] = {}
+    metrics_gauge_names: Dict[str, str] = {}
+
+    def collect_snapshot(snapshot, prefix, updates):
+        if not snapshot:
+            return
+        try:
+            data = snapshot.as_dict(prefix=prefix)
+            _collect_changed(
+                data, prev_metrics, metrics_gauge_names, "metrics_", updates
+            )
+        except Exception as exc:
+            if TELEMETRY_LOG.isEnabledFor(logging.DEBUG):
+                TELEMETRY_LOG.debug("snapshot publish failed: %s", exc)
 
-        def publish_snapshot(snapshot, prefix):
-            if not snapshot:
-                return
+    def core_metrics_tick():
+        # Gather every changed gauge, then publish them under one lock.
+        updates: Dict[str, float] = {}
+        if get_fee_stats is not None:
             try:
-                data = snapshot.as_dict(prefix=prefix)
-                for key, value in data.items():
-                    telemetry.set_gauge(f"metrics_{key}", float(value))
+                _collect_changed(
+                    get_fee_stats(), prev_fee, fee_gauge_names, "fees_", updates
+                )
             except Exception as exc:
-                logging.getLogger("telemetry").debug("snapshot publish failed: %s", exc)
-
-        while not stop_event.is_set():
-            telemetry.set_gauge("uptime_seconds", max(0.0, time.time() - start_ts))
-            if state and hasattr(state, "get_fee_stats"):
-                try:
-                    stats = state.get_fee_stats()
-                    for key, value in stats.items():
-                        telemetry.set_gauge(f"fees_{key}", float(value))
-                except Exception as exc:
-                    logging.getLogger("telemetry").debug("fee stats update failed: %s", exc)
-            if metrics_compositor:
-                try:
-                    mids_override = {}
-                    if state and hasattr(state, "get_inventory") and hasattr(state, "get_mid"):
-                        try:
-                            inv_map = state.get_inventory()
-                            if isinstance(inv_map, dict):
-                                for market in inv_map.keys():
-                                    mid_val = state.get_mid(market)
-                                    if mid_val is not None:
-                                        mids_override[market] = float(mid_val)
-                        except Exception:
-                            mids_override = {}
-                    total_snapshot = metrics_compositor.snapshot(mids_override=mids_override)
-                    rolling_snapshot = metrics_compositor.snapshot(
-                        window_seconds=rolling_seconds,
-                        mids_override=mids_override,
-                    )
-                    publish_snapshot(total_snapshot, "total_")
-                    publish_snapshot(rolling_snapshot, f"rolling_{int(rolling_seconds // 3600)}h_")
-                except Exception as exc:
-                    logging.getLogger("telemetry").debug("metrics compositor failed: %s", exc)
-            await asyncio.sleep(5.0)
-
-    tasks.append(asyncio.create_task(periodic_core_metrics(), name="metrics"))
+                if TELEMETRY_LOG.isEnabledFor(logging.DEBUG):
+                    TELEMETRY_LOG.debug("fee stats update failed: %s", exc)
+        if metrics_compositor:
+            try:
+                mids_override = {}
+                if get_inventory is not None:
+                    try:
+                        inv_map = get_inventory()
+                        if isinstance(inv_map, Mapping):
+                            for market in inv_map.keys():
+                                mid_val = get_mid(market)
+                                if mid_val is not None:
+                                    mids_override[market] = (
+                                        mid_val
+                                        if type(mid_val) is float
+                                        else float(mid_val)
+                                    )
+                    except Exception:
+                        mids_override = {}
+                total_snapshot = metrics_compositor.snapshot(
+                    mids_override=mids_override
+                )
+                rolling_snapshot = metrics_compositor.snapshot(
+                    window_seconds=rolling_seconds,
+                    mids_override=mids_override,
+                )
+                collect_snapshot(total_snapshot, "total_", updates)
+                collect_snapshot(rolling_snapshot, rolling_prefix, updates)
+            except Exception as exc:
+                if TELEMETRY_LOG.isEnabledFor(logging.DEBUG):
+                    TELEMETRY_LOG.debug("metrics compositor failed: %s", exc)
+        if updates:
+            set_gauges(updates)
 
     if (
         maker
@@ -962,7 +1210,7 @@ async def main():
         async def pnl_guard_loop():
             consecutive = 0
             guard_active = False
-            log = logging.getLogger("main")
+            log = MAIN_LOG
             log.info(
                 "[main] PnL guard enabled: window=%ss floor=%.4f widen=%.2fbps size=%.2fx",
                 guard_window,
@@ -975,7 +1223,7 @@ async def main():
                 if state and hasattr(state, "get_inventory") and hasattr(state, "get_mid"):
                     try:
                         inv_map = state.get_inventory()
-                        if isinstance(inv_map, dict):
+                        if isinstance(inv_map, Mapping):
                             for market in inv_map.keys():
                                 mid_val = state.get_mid(market)
                                 if mid_val is not None:
@@ -990,7 +1238,8 @@ async def main():
                     )
                     realized_quote = float(snapshot.realized_quote)
                 except Exception as exc:
-                    log.debug("[main] pnl_guard snapshot failed: %s", exc)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("[main] pnl_guard snapshot failed: %s", exc)
                 if telemetry:
                     try:
                         telemetry.set_gauge(
@@ -1018,26 +1267,25 @@ async def main():
     async def run_component(name: str, comp):
         if not comp:
             return
-        logging.getLogger("main").info("[%s] starting.", name)
+        MAIN_LOG.info("[%s] starting.", name)
 
-        if hasattr(comp, "run") and asyncio.iscoroutinefunction(comp.run):
+        entrypoint = _component_entrypoint(type(comp))
+        if entrypoint == "run":
             await comp.run()
             return
-        if hasattr(comp, "start") and asyncio.iscoroutinefunction(comp.start):
+        if entrypoint == "start_async":
             await comp.start()
             return
-        if hasattr(comp, "start") and callable(comp.start):
+        if entrypoint == "start":
             result = comp.start()
-            if inspect.iscoroutine(result):
+            if asyncio.iscoroutine(result):
                 await result
             elif isinstance(result, asyncio.Task):
                 await result
             else:
-                logging.getLogger("main").info("[%s] started (self-managed).", name)
+                MAIN_LOG.info("[%s] started (self-managed).", name)
                 return
-        logging.getLogger("main").info(
-            "[%s] no run/start; assuming self-managed.", name
-        )
+        MAIN_LOG.info("[%s] no run/start; assuming self-managed.", name)
 
     if chaos and chaos.enabled:
         # Start chaos injector background task
@@ -1068,9 +1316,10 @@ async def main():
 
     # --- Mean Reversion Trader ---
     mean_reversion_trader = None
-    if MeanReversionTrader:
-        trader_cfg = cfg.get("mean_reversion") or {}
-        if bool(trader_cfg.get("enabled", False)):
+    trader_cfg = cfg.get("mean_reversion") or {}
+    if bool(trader_cfg.get("enabled", False)):
+        MeanReversionTrader = _optional("MeanReversionTrader")
+        if MeanReversionTrader:
             try:
                 mean_reversion_trader = MeanReversionTrader(
                     config=cfg,
@@ -1079,9 +1328,9 @@ async def main():
                     alert_manager=alert_mgr,
                     telemetry=telemetry,
                 )
-                logging.getLogger("main").info("[main] MeanReversionTrader initialized")
+                MAIN_LOG.info("[main] MeanReversionTrader initialized")
             except Exception as exc:
-                logging.getLogger("main").warning("[main] MeanReversionTrader init failed: %s", exc)
+                MAIN_LOG.warning("[main] MeanReversionTrader init failed: %s", exc)
 
     if mean_reversion_trader:
         tasks.append(asyncio.create_task(run_component("mean_reversion", mean_reversion_trader)))
@@ -1091,74 +1340,111 @@ async def main():
     ws_stale_sec = int(wd_cfg.get("ws_stale_seconds", 30))
     quote_stale_sec = int(wd_cfg.get("quote_stale_seconds", 20))
     resend_every_sec = int(wd_cfg.get("reminder_every_seconds", 300))
-    last_ws_alert = 0.0
-    last_quote_alert = 0.0
+    # Resend throttling runs on the monotonic clock; heartbeat ages stay on
+    # wall-clock time because telemetry stamps heartbeats with time.time().
+    last_ws_alert = float("-inf")
+    last_quote_alert = float("-inf")
+
+    get_heartbeats = telemetry.get_heartbeats
+    alert_warning = alert_mgr.warning
 
-    async def watchdogs():
+    def watchdog_tick():
         nonlocal last_ws_alert, last_quote_alert
-        logging.getLogger("main").info(
-            "[main] watchdogs enabled. ws_stale=%ss quote_stale=%ss",
-            ws_stale_sec,
-            quote_stale_sec,
-        )
-        while not stop_event.is_set():
-            now = time.time()
-            _, _, hbs = telemetry.metrics.snapshot()
-            ws_last = hbs.get("ws")
-            qt_last = hbs.get("quote")
-
-            if ws_last:
-                ws_age = now - ws_last
-                if ws_age > ws_stale_sec and (now - last_ws_alert) > resend_every_sec:
-                    last_ws_alert = now
-                    fire_and_forget(
-                        alert_mgr.warning(
-                            "WebSocket appears stale",
-                            message=f"No WS frames for {int(ws_age)}s.",
-                            fields={"ws_last_ts": ws_last, "ws_age_s": int(ws_age)},
-                        )
-                    )
+        now = time.time()
+        mono = time.monotonic()
+        hbs = get_heartbeats()
+        ws_last = hbs.get("ws")
+        qt_last = hbs.get("quote")
+
+        if ws_last:
+            ws_age = now - ws_last
+            if ws_age > ws_stale_sec and (mono - last_ws_alert) > resend_every_sec:
+                last_ws_alert = mono
+                queue_alert(
+                    alert_warning,
+                    "WebSocket appears stale",
+                    f"No WS frames for {int(ws_age)}s.",
+                    {"ws_last_ts": ws_last, "ws_age_s": int(ws_age)},
+                )
 
-            if qt_last:
-                q_age = now - qt_last
-                if (
-                    q_age > quote_stale_sec
-                    and (now - last_quote_alert) > resend_every_sec
-                ):
-                    last_quote_alert = now
-                    fire_and_forget(
-                        alert_mgr.warning(
-                            "Maker quotes stale",
-                            message=f"No quotes emitted for {int(q_age)}s.",
-                            fields={
-                                "quote_last_ts": qt_last,
-                                "quote_age_s": int(q_age),
-                            },
-                        )
-                    )
-            await asyncio.sleep(2.0)
+        if qt_last:
+            q_age = now - qt_last
+            if q_age > quote_stale_sec and (mono - last_quote_alert) > resend_every_sec:
+                last_quote_alert = mono
+                queue_alert(
+                    alert_warning,
+                    "Maker quotes stale",
+                    f"No quotes emitted for {int(q_age)}s.",
+                    {"quote_last_ts": qt_last, "quote_age_s": int(q_age)},
+                )
 
-    tasks.append(asyncio.create_task(watchdogs(), name="watchdogs"))
+    # One self-rescheduling 1 Hz callback drives the watchdogs (every 2s)
+    # and the core metrics (every 5s); no coroutine or Task stays alive.
+    periodic_tick_no = 0
+    periodic_handle: Optional[asyncio.Handle] = None
 
-    logging.getLogger("main").info("Starting %s (M7 Telemetry & Alerts)...", app)
+    def periodic_tick():
+        nonlocal periodic_tick_no, periodic_handle
+        try:
+            if periodic_tick_no % 5 == 0:
+                core_metrics_tick()
+            if periodic_tick_no % 2 == 0:
+                watchdog_tick()
+        finally:
+            periodic_tick_no += 1
+            periodic_handle = loop.call_later(1.0, periodic_tick)
+
+    MAIN_LOG.info(
+        "[main] watchdogs enabled. ws_stale=%ss quote_stale=%ss",
+        ws_stale_sec,
+        quote_stale_sec,
+    )
+    periodic_handle = loop.call_soon(periodic_tick)
+
+    MAIN_LOG.info("Starting %s (M7 Telemetry & Alerts)...", app)
     try:
         await stop_event.wait()
     finally:
-        logging.getLogger("main").info("Shutting down...")
+        MAIN_LOG.info("Shutting down...")
+        periodic_handle.cancel()
         for t in tasks:
             t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        if metrics_ledger:
+            metrics_ledger.close()
         telemetry.set_gauge("shutdown_ts", time.time())
-        fire_and_forget(alert_mgr.info("Shutdown", f"{app} stopped."))
+        queue_alert(alert_mgr.info, "Shutdown", f"{app} stopped.")
+        # Give queued alerts (including the one above) a bounded chance to go out.
+        try:
+            await asyncio.wait_for(alert_queue.join(), timeout=5.0)
+        except asyncio.TimeoutError:
+            MAIN_LOG.warning("[main] %d alerts unsent at shutdown", alert_queue.qsize())
+        alert_task.cancel()
         if shared_trading_client:
             try:
                 await shared_trading_client.close()
             except Exception as exc:
-                logging.getLogger("main").debug("[main] shared trading client close failed: %s", exc)
+                MAIN_LOG.debug("[main] shared trading client close failed: %s", exc)
+        # RestClient pools one HTTP session per loop; only close it if some
+        # component actually loaded the (aiohttp-backed) REST client.
+        rest_client_mod = sys.modules.get("core.rest_client")
+        if rest_client_mod is not None:
+            try:
+                await rest_client_mod.RestClient.close_shared_session()
+            except Exception as exc:
+                MAIN_LOG.debug("[main] REST session close failed: %s", exc)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        import uvloop  # pinned in requirements.txt on Linux
+    except ImportError:  # noqa
+        uvloop = None  # type: ignore
+
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         sys.exit(130)
@@ -1,10 +1,44 @@
 import os
 import json
 import logging
-from decimal import Decimal, InvalidOperation
+
+try:
+    import orjson
+except ImportError:  # noqa
+    orjson = None  # type: ignore
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
+# Per-frame logs are DEBUG; an INFO summary is emitted every N frames.
+_SUMMARY_EVERY = 1000
+
+# Field variants, in precedence order.
+_MID_KEYS = ("mark_price", "markPrice", "mid")
+_INDEX_KEYS = ("index_price", "indexPrice", "index")
+_LAST_KEYS = ("last_price", "lastPrice", "last")
+
+
+def _to_float(x):
+    # Mids feed quoting, not settlement, so floats are precise enough.
+    if x is None:
+        return None
+    try:
+        return float(x)
+    except (ValueError, TypeError):
+        return None
+
+
+def _first_nonzero(get, keys):
+    # Same result as _to_float(get(k1)) or _to_float(get(k2)) or ...
+    value = None
+    for k in keys:
+        value = _to_float(get(k))
+        if value:
+            break
+    return value
+
 
 class MessageRouter:
     """
@@ -24,16 +58,13 @@ class MessageRouter:
         self._debug_count = 0
         self._debug_limit = 3
         self._debug_enabled = os.getenv("ROUTER_DEBUG", "0") == "1"
+        self._routed_count = 0
+        # One state call per frame when the store supports batching.
+        self._update_mids = (
+            getattr(state_store, "update_mids", None) or self._update_mids_each
+        )
 
     # ---------- helpers ----------
-    def _to_dec(self, x):
-        if x is None:
-            return None
-        try:
-            return Decimal(str(x))
-        except (InvalidOperation, ValueError, TypeError):
-            return None
-
     def _norm_pair(self, market_id):
         # normalize to "market:<id>" string; allow strings already in that form
         if market_id is None:
@@ -49,31 +80,28 @@ class MessageRouter:
         if not isinstance(e, dict):
             return (None, None)
 
-        mid = None
         # possible ids
-        market_id = e.get("market_id") or e.get("marketId") or e.get("id")
+        get = e.get
+        market_id = get("market_id") or get("marketId") or get("id")
         pair = self._norm_pair(market_id)
 
-        # price candidates
-        for k in ("mark_price", "markPrice", "mid"):
-            mid = self._to_dec(e.get(k))
-            if mid is not None:
-                break
+        # price candidates: first key present with a parsable value
+        mid = None
+        for k in _MID_KEYS:
+            v = get(k)
+            if v is not None:
+                try:
+                    mid = float(v)
+                    break
+                except (ValueError, TypeError):
+                    pass
 
         if mid is None:
             # attempt average of index + last (with multiple key variants)
-            index = (
-                self._to_dec(e.get("index_price"))
-                or self._to_dec(e.get("indexPrice"))
-                or self._to_dec(e.get("index"))
-            )
-            last = (
-                self._to_dec(e.get("last_price"))
-                or self._to_dec(e.get("lastPrice"))
-                or self._to_dec(e.get("last"))
-            )
+            index = _first_nonzero(get, _INDEX_KEYS)
+            last = _first_nonzero(get, _LAST_KEYS)
             if index is not None and last is not None:
-                mid = (index + last) / Decimal("2")
+                mid = (index + last) * 0.5
 
         return (pair, mid)
 
@@ -96,82 +124,76 @@ class MessageRouter:
         except Exception:
             pass
 
+    def _update_mids_each(self, mids):
+        for pair, mid in mids.items():
+            self.state.update_mid(pair, mid)
+
+    def _route_entries(self, entries, debug):
+        """Push every mid found in entries to state; True if any was found."""
+        mids = {}
+        for e in entries:
+            pair, mid = self._derive_mid_from_entry(e)
+            if pair and mid is not None:
+                mids[pair] = mid
+                if debug:
+                    logger.debug("[router] mid updated %s -> %s", pair, mid)
+        if not mids:
+            return False
+        self._update_mids(mids)
+        return True
+
     # ---------- main entry ----------
-    def route(self, raw_text: str):
-        # Some gateways may batch JSON lines
-        chunks = [x for x in raw_text.splitlines() if x.strip()] or [raw_text]
+    def route(self, raw_text):
+        # Accepts str or bytes frames. Some gateways may batch JSON lines;
+        # single-object frames (the common case) skip the split entirely.
+        # A trailing "\r" is left on CRLF lines; the JSON decoders ignore it.
+        nl = b"\n" if isinstance(raw_text, bytes) else "\n"
+        if nl not in raw_text:
+            chunks = (raw_text,)
+        else:
+            chunks = [x for x in raw_text.split(nl) if x] or (raw_text,)
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         for chunk in chunks:
             try:
-                d = json.loads(chunk)
+                d = _loads(chunk)
             except Exception:
                 # silently ignore non-JSON messages
                 continue
 
-            channel = d.get("channel") or d.get("topic")
-            typ = d.get("type") or d.get("event") or d.get("op")
+            self._routed_count += 1
+            if self._routed_count % _SUMMARY_EVERY == 0:
+                logger.info("[router] routed %d frames", self._routed_count)
 
             # log what we see
-            logger.info("[router] got frame channel=%s type=%s", channel, typ)
-
-            # 1) Direct "market_stats" key
-            if (
-                isinstance(d, dict)
-                and "market_stats" in d
-                and isinstance(d["market_stats"], list)
-            ):
-                any_mid = False
-                for e in d["market_stats"]:
-                    pair, mid = self._derive_mid_from_entry(e)
-                    if pair and mid is not None:
-                        self.state.update_mid(pair, mid)
-                        any_mid = True
-                        logger.info("[router] mid updated %s -> %s", pair, mid)
-                if any_mid:
-                    continue  # handled
-
-            # 2) Common "data" wrapping
-            data = d.get("data")
-            if isinstance(data, list):
-                any_mid = False
-                for e in data:
-                    pair, mid = self._derive_mid_from_entry(e)
-                    if pair and mid is not None:
-                        self.state.update_mid(pair, mid)
-                        any_mid = True
-                        logger.info("[router] mid updated %s -> %s", pair, mid)
-                if any_mid:
-                    continue
-
-            if isinstance(data, dict):
-                # e.g. data: { updates: [ ... ] }
-                updates = data.get("updates") or data.get("markets") or data.get("rows")
-                if isinstance(updates, list):
-                    any_mid = False
-                    for e in updates:
-                        pair, mid = self._derive_mid_from_entry(e)
-                        if pair and mid is not None:
-                            self.state.update_mid(pair, mid)
-                            any_mid = True
-                            logger.info("[router] mid updated %s -> %s", pair, mid)
-                    if any_mid:
-                        continue
-
-            # 3) Top-level list (rare but possible if gateway strips wrapper)
-            if isinstance(d, list):
-                any_mid = False
-                for e in d:
-                    pair, mid = self._derive_mid_from_entry(e)
-                    if pair and mid is not None:
-                        self.state.update_mid(pair, mid)
-                        any_mid = True
-                        logger.info("[router] mid updated %s -> %s", pair, mid)
-                if any_mid:
-                    continue
-
-            # If we got here, we didn’t extract mids
-            self._log_unknown(d)
+            if debug and isinstance(d, dict):
+                channel = d.get("channel") or d.get("topic")
+                typ = d.get("type") or d.get("event") or d.get("op")
+                logger.debug("[router] got frame channel=%s type=%s", channel, typ)
+
+            # Candidate entry lists in precedence order:
+            #   1) direct "market_stats" key
+            #   2) common "data" wrapping, list or { updates/markets/rows: [...] }
+            #   3) top-level list (rare but possible if gateway strips wrapper)
             if isinstance(d, dict):
-                logger.info(
-                    "[router] no mids extracted; keys seen: top=%s", list(d.keys())[:5]
-                )
+                data = d.get("data")
+                nested = None
+                if isinstance(data, dict):
+                    nested = (
+                        data.get("updates") or data.get("markets") or data.get("rows")
+                    )
+                candidates = (d.get("market_stats"), data, nested)
+            else:
+                candidates = (d,)
+
+            for entries in candidates:
+                if isinstance(entries, list) and self._route_entries(entries, debug):
+                    break
+            else:
+                # If we got here, we didn’t extract mids
+                self._log_unknown(d)
+                if debug and isinstance(d, dict):
+                    logger.debug(
+                        "[router] no mids extracted; keys seen: top=%s",
+                        list(d.keys())[:5],
+                    )
@@ -1,18 +1,64 @@
 # core/rest_client.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import time
+from dataclasses import dataclass, fields
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # noqa
+    orjson = None  # type: ignore
+
 from modules.funding_optimizer import PairMetrics, FundingDataSource
 
 logger = logging.getLogger(__name__)
 
+# Assumed batch metrics endpoint (not wired to a live API yet): without a
+# "symbols" param it returns every market, otherwise only the listed ones.
+_METRICS_BATCH_PATH = "metrics/batch"
+_METRICS_CHUNK = 100
+_METRICS_TTL_NS = 5_000_000_000
+_PAIR_METRIC_FIELDS = tuple(f.name for f in fields(PairMetrics))
+_PAIR_METRIC_TEXT_FIELDS = frozenset(("market_id", "symbol"))
+
+
+def _metric_rows(body: Any) -> List[Dict[str, Any]]:
+    # Accept a bare list or the usual {"data": [...]} wrapper.
+    if isinstance(body, dict):
+        body = body.get("data")
+    if not isinstance(body, list):
+        return []
+    return [row for row in body if isinstance(row, dict)]
+
+
+def _pair_metrics_from_row(row: Dict[str, Any]) -> Optional[PairMetrics]:
+    # Numbers often arrive as strings ("0.0001"); the optimizer needs floats.
+    # A malformed row is dropped on its own instead of failing the batch.
+    if not row.get("market_id"):
+        return None
+    values: Dict[str, Any] = {}
+    for name in _PAIR_METRIC_FIELDS:
+        value = row.get(name)
+        if value is None:
+            continue
+        if name in _PAIR_METRIC_TEXT_FIELDS:
+            values[name] = str(value)
+            continue
+        try:
+            values[name] = float(value)
+        except (TypeError, ValueError):
+            logger.debug("[rest] skipping metrics row with bad %s: %r", name, row)
+            return None
+    return PairMetrics(**values)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RestConfig:
     base_url: str
     api_key: Optional[str] = None
@@ -21,38 +67,119 @@ class RestConfig:
 
 
 class RestClient(FundingDataSource):
+    # One pooled keep-alive session per event loop, shared by every RestClient
+    # on that loop; per-instance timeouts are applied per request. Keyed by
+    # loop because a ClientSession is bound to the loop that created it.
+    _shared_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
     def __init__(self, cfg: RestConfig):
         self._cfg = cfg
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._metrics_cache: Dict[Tuple[str, ...], Tuple[int, List[PairMetrics]]] = {}
+        self._metrics_lock = asyncio.Lock()
+        self._base_url = cfg.base_url.rstrip("/") + "/"
+        self._timeout = aiohttp.ClientTimeout(total=cfg.timeout_s)
+        self._headers: Dict[str, str] = {}
+        if cfg.api_key:
+            self._headers["X-API-KEY"] = cfg.api_key
+
+    @classmethod
+    async def get_shared_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = cls._shared_sessions.get(loop)
+        if session is None or session.closed:
+            # No await between the check and the store, so callers on the same
+            # loop cannot race to create two sessions.
+            for stale in [lp for lp in cls._shared_sessions if lp.is_closed()]:
+                del cls._shared_sessions[stale]
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            session = cls._shared_sessions[loop] = aiohttp.ClientSession(
+                connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+            )
+        return session
+
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """Close the running loop's shared session; call once at shutdown."""
+        session = cls._shared_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
 
     async def ensure_session(self) -> None:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self._cfg.timeout_s)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+        await self.get_shared_session()
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        # The session is shared with other clients on this loop and is closed
+        # by close_shared_session() at shutdown; drop per-instance state only.
+        self._metrics_cache.clear()
 
     async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        await self.ensure_session()
-        url = self._cfg.base_url.rstrip("/") + "/" + path.lstrip("/")
-        headers = {}
-        if self._cfg.api_key:
-            headers["X-API-KEY"] = self._cfg.api_key
-        async with self._session.get(url, headers=headers, params=params) as resp:
+        session = await self.get_shared_session()
+        url = self._base_url + path.lstrip("/")
+        async with session.get(
+            url, headers=self._headers, params=params, timeout=self._timeout
+        ) as resp:
             resp.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(await resp.read())
             return await resp.json()
 
     # --- M6: metrics provider ---
-    async def fetch_pair_metrics(self) -> List[PairMetrics]:
+    async def fetch_pair_metrics(
+        self, symbols: Optional[Sequence[str]] = None, chunk: int = _METRICS_CHUNK
+    ) -> List[PairMetrics]:
         """
-        Return funding/OI/spread metrics for all candidate markets.
-        If the real endpoints aren’t wired yet, return [] to disable optimization.
+        Return funding/OI/spread metrics for all candidate markets, or only for
+        `symbols` when given. Called with no arguments (as the optimizer does)
+        this is a single request for every market; with symbols it is one
+        batch request per `chunk` symbols, run concurrently. Results, and
+        the empty result of a failed fetch, are cached per symbol set for
+        _METRICS_TTL_NS.
         """
-        try:
-            # TODO: replace with real endpoints when available and return a list of PairMetrics.
-            return []
-        except Exception as e:
-            logger.warning("[rest] fetch_pair_metrics failed: %s", e)
-            return []
+        key = tuple(sorted(symbols)) if symbols else ()
+        cached = self._fresh_metrics(key)
+        if cached is not None:
+            return cached
+        # Single flight: callers arriving mid-fetch wait and reuse its result.
+        async with self._metrics_lock:
+            cached = self._fresh_metrics(key)
+            if cached is not None:
+                return cached
+            try:
+                if key:
+                    it = iter(key)
+                    chunks = list(iter(lambda: tuple(islice(it, chunk)), ()))
+                    bodies = await asyncio.gather(
+                        *(
+                            self._get(
+                                _METRICS_BATCH_PATH, params={"symbols": ",".join(c)}
+                            )
+                            for c in chunks
+                        )
+                    )
+                else:
+                    bodies = [await self._get(_METRICS_BATCH_PATH)]
+                out = [
+                    pm
+                    for body in bodies
+                    for row in _metric_rows(body)
+                    if (pm := _pair_metrics_from_row(row)) is not None
+                ]
+            except Exception as e:
+                # Cache the miss too so an unavailable endpoint is retried
+                # once per TTL rather than on every optimizer scan.
+                logger.debug("[rest] fetch_pair_metrics failed: %s", e)
+                out = []
+            self._metrics_cache[key] = (time.monotonic_ns(), out)
+        return list(out)
+
+    def _fresh_metrics(self, key: Tuple[str, ...]) -> Optional[List[PairMetrics]]:
+        cached = self._metrics_cache.get(key)
+        if cached is not None and time.monotonic_ns() - cached[0] < _METRICS_TTL_NS:
+            return list(cached[1])
+        return None
@@ -3,10 +3,19 @@ from __future__ import annotations
 
 import time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
 
 from modules.funding_optimizer import PairMetrics
 
+_ZERO = Decimal("0")
+_NO_ORDERS: Dict[str, Dict[str, Any]] = {}
+
+
+def _dec(value: Any) -> Decimal:
+    # Fill paths already pass Decimals; skip the str() round-trip for those.
+    return value if type(value) is Decimal else Decimal(str(value))
+
 
 class StateStore:
     """
@@ -22,17 +31,26 @@ class StateStore:
         self._synthetic_mids: Dict[str, float] = {}
 
         # M6 optimizer state
-        self._active_pairs: List[str] = []
+        self._active_pairs: Tuple[str, ...] = ()
         self._pair_metrics: Dict[str, PairMetrics] = {}
+        self._pair_metrics_view: Mapping[str, PairMetrics] = MappingProxyType(
+            self._pair_metrics
+        )
 
         # Account info
         self._account_index: Optional[str] = None
 
         # Inventory tracking (per-market position in base units)
         self._inventory: Dict[str, Decimal] = {}  # market_id -> position
+        self._inventory_view: Mapping[str, Decimal] = MappingProxyType(self._inventory)
 
         # Order tracking
         self._open_orders: Dict[str, Dict[str, Any]] = {}  # order_id -> order info
+        self._open_orders_view: Mapping[str, Dict[str, Any]] = MappingProxyType(
+            self._open_orders
+        )
+        # market -> {order_id -> order info}, kept in step with _open_orders
+        self._orders_by_market: Dict[Any, Dict[str, Dict[str, Any]]] = {}
 
         # Guard block tracking (per market)
         self._guard_block_since: Dict[str, float] = {}
@@ -73,6 +91,12 @@ class StateStore:
         else:
             self._mids[market_id] = float(price)
 
+    def update_mids(self, mids: Dict[str, Union[float, Decimal]]) -> None:
+        """Batch form of update_mid (one call per routed frame)."""
+        self._mids.update(
+            {market_id: float(price) for market_id, price in mids.items()}
+        )
+
     def get_mid(self, market_id: str) -> Optional[float]:
         return self._mids.get(market_id)
 
@@ -83,17 +107,20 @@ class StateStore:
         return self._synthetic_mids.get(market_id)
 
     # -------- Optimizer ----------
-    def set_active_pairs(self, pairs: List[str]) -> None:
-        self._active_pairs = list(pairs or [])
+    # Getters return read-only views (tuples / mapping proxies) rather than
+    # copies; they reflect later updates, so copy them if you need a snapshot.
+    def set_active_pairs(self, pairs: Sequence[str]) -> None:
+        self._active_pairs = tuple(pairs or ())
 
-    def get_active_pairs(self) -> List[str]:
-        return list(self._active_pairs)
+    def get_active_pairs(self) -> Tuple[str, ...]:
+        return self._active_pairs
 
     def set_pair_metrics(self, metrics: Dict[str, PairMetrics]) -> None:
         self._pair_metrics = dict(metrics or {})
+        self._pair_metrics_view = MappingProxyType(self._pair_metrics)
 
-    def get_pair_metrics(self) -> Dict[str, PairMetrics]:
-        return dict(self._pair_metrics)
+    def get_pair_metrics(self) -> Mapping[str, PairMetrics]:
+        return self._pair_metrics_view
 
     # -------- Account ----------
     def set_account_index(self, account_index: Optional[str]) -> None:
@@ -103,40 +130,54 @@ class StateStore:
         return self._account_index
 
     # -------- Inventory ----------
-    def get_inventory(self, market_id: Optional[str] = None) -> Union[Decimal, Dict[str, Decimal]]:
-        """Get inventory for a specific market, or all markets if None."""
+    def get_inventory(
+        self, market_id: Optional[str] = None
+    ) -> Union[Decimal, Mapping[str, Decimal]]:
+        """Get inventory for a specific market, or a read-only view of all markets if None."""
         if market_id is None:
-            return dict(self._inventory)
-        return self._inventory.get(market_id, Decimal("0"))
+            return self._inventory_view
+        return self._inventory.get(market_id, _ZERO)
 
     def update_inventory(self, market_id: str, delta: Decimal) -> None:
         """Update inventory by delta (positive for long, negative for short)."""
-        if market_id not in self._inventory:
-            self._inventory[market_id] = Decimal("0")
-        self._inventory[market_id] += Decimal(str(delta))
+        inventory = self._inventory
+        inventory[market_id] = inventory.get(market_id, _ZERO) + _dec(delta)
 
     def set_inventory(self, market_id: str, value: Decimal) -> None:
         """Set absolute inventory value."""
-        self._inventory[market_id] = Decimal(str(value))
+        self._inventory[market_id] = _dec(value)
 
     # -------- Orders ----------
     def add_order(self, order_id: str, order_info: Dict[str, Any]) -> None:
         """Add an open order."""
-        self._open_orders[order_id] = dict(order_info)
+        if order_id in self._open_orders:
+            self._unindex_order(order_id, self._open_orders[order_id])
+        info = dict(order_info)
+        self._open_orders[order_id] = info
+        self._orders_by_market.setdefault(info.get("market"), {})[order_id] = info
 
     def remove_order(self, order_id: str) -> Optional[Dict[str, Any]]:
         """Remove an order and return its info."""
-        return self._open_orders.pop(order_id, None)
-
-    def get_orders(self, market_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
-        """Get all orders, optionally filtered by market."""
+        info = self._open_orders.pop(order_id, None)
+        if info is not None:
+            self._unindex_order(order_id, info)
+        return info
+
+    def _unindex_order(self, order_id: str, info: Dict[str, Any]) -> None:
+        market = info.get("market")
+        bucket = self._orders_by_market.get(market)
+        if bucket is not None:
+            bucket.pop(order_id, None)
+            if not bucket:
+                del self._orders_by_market[market]
+
+    def get_orders(
+        self, market_id: Optional[str] = None
+    ) -> Mapping[str, Dict[str, Any]]:
+        """Get all orders (read-only view), optionally filtered by market."""
         if market_id is None:
-            return dict(self._open_orders)
-        return {
-            oid: info
-            for oid, info in self._open_orders.items()
-            if info.get("market") == market_id
-        }
+            return self._open_orders_view
+        return MappingProxyType(self._orders_by_market.get(market_id, _NO_ORDERS))
 
     # -------- Guard tracking ----------
     def mark_guard_blocked(self, market_id: Optional[str], timestamp: Optional[float] = None) -> None:
@@ -175,19 +216,19 @@ class StateStore:
     ) -> None:
         role_key = role.lower()
         if role_key == "maker":
-            self._volume_stats["maker_notional"] += Decimal(str(notional))
-            self._volume_stats["maker_fee_actual"] += Decimal(str(fee_actual))
-            self._volume_stats["maker_fee_premium"] += Decimal(str(fee_premium))
+            self._volume_stats["maker_notional"] += _dec(notional)
+            self._volume_stats["maker_fee_actual"] += _dec(fee_actual)
+            self._volume_stats["maker_fee_premium"] += _dec(fee_premium)
             self._fill_counts["maker"] += 1
         elif role_key == "taker":
-            self._volume_stats["taker_notional"] += Decimal(str(notional))
-            self._volume_stats["taker_fee_actual"] += Decimal(str(fee_actual))
-            self._volume_stats["taker_fee_premium"] += Decimal(str(fee_premium))
+            self._volume_stats["taker_notional"] += _dec(notional)
+            self._volume_stats["taker_fee_actual"] += _dec(fee_actual)
+            self._volume_stats["taker_fee_premium"] += _dec(fee_premium)
             self._fill_counts["taker"] += 1
 
     def record_hedger_simulation(self, notional: Decimal, fee_premium: Decimal) -> None:
-        self._volume_stats["hedger_notional"] += Decimal(str(notional))
-        self._volume_stats["hedger_fee_premium"] += Decimal(str(fee_premium))
+        self._volume_stats["hedger_notional"] += _dec(notional)
+        self._volume_stats["hedger_fee_premium"] += _dec(fee_premium)
 
     def get_fee_stats(self) -> Dict[str, float]:
         out: Dict[str, float] = {}
@@ -198,14 +239,14 @@ class StateStore:
         return out
 
     def record_maker_edge(self, value: Decimal) -> None:
-        self._pnl_stats["maker_edge"] += Decimal(str(value))
+        self._pnl_stats["maker_edge"] += _dec(value)
 
     def record_taker_slippage(self, value: Decimal) -> None:
-        self._pnl_stats["taker_slippage"] += Decimal(str(value))
+        self._pnl_stats["taker_slippage"] += _dec(value)
 
     def record_cash_flow(self, quote_delta: Decimal, fee_paid: Decimal) -> None:
-        self._pnl_realized_quote += Decimal(str(quote_delta)) - Decimal(str(fee_paid))
-        self._pnl_fees_paid += Decimal(str(fee_paid))
+        self._pnl_realized_quote += _dec(quote_delta) - _dec(fee_paid)
+        self._pnl_fees_paid += _dec(fee_paid)
 
     def get_pnl_stats(self) -> Dict[str, float]:
         return {key: float(val) for key, val in self._pnl_stats.items()}
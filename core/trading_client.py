@@ -37,11 +37,13 @@ Usage flow (async):
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import logging
 import time
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
 
 LOG = logging.getLogger("trading")
@@ -55,7 +57,37 @@ except Exception:  # pragma: no cover - handled lazily in TradingClient
     lighter = None  # type: ignore
 
 
-@dataclass(slots=True)
+_ONE = Decimal("1")
+
+
+def _to_decimal(value: float) -> Decimal:
+    # Floats go through str() so 0.285 scales as 28.5, not 28.4999...;
+    # Decimals and ints are already exact.
+    kind = type(value)
+    if kind is Decimal:
+        return value
+    if kind is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_market_index(market: str) -> int:
+    # Parsed once per market id; order and cancel paths hit the cache.
+    if not market:
+        raise ValueError("market identifier is required")
+    if ":" not in market:
+        raise ValueError(f"unexpected market format: {market}")
+    prefix, suffix = market.split(":", 1)
+    if prefix != "market":
+        raise ValueError(f"unsupported market prefix: {prefix}")
+    try:
+        return int(suffix)
+    except ValueError as exc:
+        raise ValueError(f"invalid market index: {market}") from exc
+
+
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     base_url: str
     api_key_private_key: str
@@ -67,7 +99,7 @@ class TradingConfig:
     max_api_key_index: Optional[int] = None
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PlacedOrder:
     """Thin representation of a placed order returned by TradingClient."""
 
@@ -79,12 +111,24 @@ class PlacedOrder:
     tx_hash: Optional[str]
 
 
+@dataclass(frozen=True, slots=True)
+class OrderSpec:
+    """One order of a create_post_only_limit_batch() call."""
+
+    market: str
+    side: str
+    price: float
+    size: float
+    reduce_only: bool = False
+    expiry: Optional[int] = None
+
+
 class TradingClient:
     def __init__(self, cfg: TradingConfig):
         self.cfg = cfg
         self._signer: Optional[SignerClient] = None
-        self._lock = asyncio.Lock()
-        self._next_client_order_index = int(time.time() * 1000)
+        # next() on a count is a single C call, so no lock is needed.
+        self._order_indices = itertools.count(time.time_ns() // 1_000_000 + 1)
 
     async def ensure_ready(self) -> None:
         if self._signer is not None:
@@ -152,6 +196,31 @@ class TradingClient:
             post_only=True,
         )
 
+    async def create_post_only_limit_batch(
+        self, orders: Sequence[OrderSpec]
+    ) -> List[Union[PlacedOrder, BaseException]]:
+        """
+        Submit several post-only limits concurrently so their signer round-trips
+        overlap. Results line up with `orders`; a failed order yields its
+        exception instead of aborting the rest of the batch.
+        """
+        # Fail fast (and once) if the signer cannot be created.
+        await self._require_signer()
+        return await asyncio.gather(
+            *(
+                self.create_post_only_limit(
+                    market=o.market,
+                    side=o.side,
+                    price=o.price,
+                    size=o.size,
+                    reduce_only=o.reduce_only,
+                    expiry=o.expiry,
+                )
+                for o in orders
+            ),
+            return_exceptions=True,
+        )
+
     async def create_limit_order(
         self,
         market: str,
@@ -165,8 +234,8 @@ class TradingClient:
         time_in_force: Optional[int] = None,
     ) -> PlacedOrder:
         signer = await self._require_signer()
-        market_index = self._parse_market_index(market)
-        client_order_index = await self._next_order_index()
+        market_index = _parse_market_index(market)
+        client_order_index = self._next_order_index()
 
         base_units = self._round_scaled_value(size, self.cfg.base_scale, "size")
         price_units = self._round_scaled_value(price, self.cfg.price_scale, "price")
@@ -222,15 +291,15 @@ class TradingClient:
         return PlacedOrder(
             market=market,
             side=side,
-            size=Decimal(str(size)),
-            price=Decimal(str(price)),
+            size=_to_decimal(size),
+            price=_to_decimal(price),
             client_order_index=client_order_index,
             tx_hash=tx_hash_value,
         )
 
     async def cancel_order(self, market: str, client_order_index: int) -> None:
         signer = await self._require_signer()
-        market_index = self._parse_market_index(market)
+        market_index = _parse_market_index(market)
 
         LOG.info(
             "[trading] cancelling order market=%s client_order_index=%s",
@@ -254,32 +323,17 @@ class TradingClient:
         assert self._signer is not None  # satisfy type-checkers
         return self._signer
 
-    async def _next_order_index(self) -> int:
-        async with self._lock:
-            self._next_client_order_index += 1
-            return self._next_client_order_index
-
-    def _parse_market_index(self, market: str) -> int:
-        if not market:
-            raise ValueError("market identifier is required")
-        if ":" not in market:
-            raise ValueError(f"unexpected market format: {market}")
-        prefix, suffix = market.split(":", 1)
-        if prefix != "market":
-            raise ValueError(f"unsupported market prefix: {prefix}")
-        try:
-            return int(suffix)
-        except ValueError as exc:
-            raise ValueError(f"invalid market index: {market}") from exc
+    def _next_order_index(self) -> int:
+        return next(self._order_indices)
 
     def _scale_value(self, raw_value: float, scale: Decimal, label: str) -> Decimal:
         if scale <= 0:
             raise ValueError(f"{label} scale must be positive (got {scale})")
-        return Decimal(str(raw_value)) * scale
+        return _to_decimal(raw_value) * scale
 
     def _round_scaled_value(self, raw_value: float, scale: Decimal, label: str) -> Decimal:
         scaled = self._scale_value(raw_value, scale, label)
-        return scaled.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        return scaled.quantize(_ONE, rounding=ROUND_HALF_UP)
 
     def _resolve_expiry(self, override: Optional[int], tif: Optional[int]) -> int:
         if override is not None:
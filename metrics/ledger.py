@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
 import time
 from dataclasses import dataclass, asdict
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # noqa
+    orjson = None  # type: ignore
 
 
 _LOCKS: Dict[Path, threading.RLock] = {}
 
 
+def _encode_line(data: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
 def _get_lock(path: Path) -> threading.RLock:
     lock = _LOCKS.get(path)
     if lock is None:
@@ -61,6 +73,13 @@ class MetricsLedger:
     Append-only JSON Lines ledger for fills.
 
     Each line contains the JSON encoding of :class:`FillEvent`.
+
+    Appends go through one persistent handle that is kept open between
+    fills; every append is flushed before it returns, so each fill is on
+    disk (and visible to other readers) as soon as it is recorded. The
+    handle is reopened whenever `path` no longer names the file it points
+    at, so archiving or rotation by another process is picked up on the
+    next append.
     """
 
     def __init__(
@@ -73,17 +92,45 @@ class MetricsLedger:
         self.path = path
         self.archive_dir = archive_dir
         self.max_bytes = max_bytes
+        self._fh: Optional[BinaryIO] = None
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if self.archive_dir:
             self.archive_dir.mkdir(parents=True, exist_ok=True)
 
     def append(self, event: FillEvent) -> None:
-        payload = json.dumps(asdict(event), separators=(",", ":"))
+        payload = _encode_line(asdict(event))
         lock = _get_lock(self.path)
         with lock:
             self._rotate_if_needed(len(payload))
-            with self.path.open("a", encoding="utf-8") as fh:
-                fh.write(payload + "\n")
+            fh = self._live_handle()
+            fh.write(payload)
+            fh.flush()
+
+    def close(self) -> None:
+        with _get_lock(self.path):
+            self._close_handle()
+
+    def _live_handle(self) -> BinaryIO:
+        # The lock only covers this process; another one may have archived
+        # or removed the file under our open handle since the last append.
+        fh = self._fh
+        if fh is not None:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                st = None
+            fst = os.fstat(fh.fileno())
+            if st is None or (st.st_ino, st.st_dev) != (fst.st_ino, fst.st_dev):
+                self._close_handle()
+                fh = None
+        if fh is None:
+            fh = self._fh = self.path.open("ab")
+        return fh
+
+    def _close_handle(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            fh.close()
 
     def iter_events(self, *, since_ts: Optional[float] = None) -> Iterator[FillEvent]:
         if not self.path.exists():
@@ -95,7 +142,9 @@ class MetricsLedger:
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
+                    data = (
+                        orjson.loads(line) if orjson is not None else json.loads(line)
+                    )
                 except json.JSONDecodeError:
                     continue
                 ts = float(data.get("timestamp", 0))
@@ -126,6 +175,7 @@ class MetricsLedger:
         """
         lock = _get_lock(self.path)
         with lock:
+            self._close_handle()
             if not self.path.exists():
                 return None
             archive_path = None
@@ -138,7 +188,7 @@ class MetricsLedger:
             return archive_path
 
     def _rotate_if_needed(self, incoming_bytes: int) -> None:
-        if self.max_bytes is None or not self.path.exists():
+        if self.max_bytes is None:
             return
         try:
             current_size = self.path.stat().st_size
@@ -146,6 +196,7 @@ class MetricsLedger:
             return
         if current_size + incoming_bytes <= self.max_bytes:
             return
+        self._close_handle()
         if not self.archive_dir:
             # Best effort truncate to keep file bounded.
             self.path.unlink(missing_ok=True)
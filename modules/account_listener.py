@@ -5,6 +5,7 @@ import json
 import logging
 import time
 from collections import deque, defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, Optional
@@ -560,7 +561,7 @@ class AccountListener:
         elif self.state and hasattr(self.state, "get_inventory"):
             try:
                 inventory = self.state.get_inventory()
-                if isinstance(inventory, dict):
+                if isinstance(inventory, Mapping):
                     markets.update(inventory.keys())
             except Exception:
                 pass
@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Sequence, Tuple
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PairMetrics:
     market_id: str  # canonical id, e.g. "market:1"
     symbol: Optional[str] = None  # optional human-readable, e.g. "BTC-PERP"
@@ -4,7 +4,7 @@ import logging
 import threading
 import time
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 LOG = logging.getLogger("telemetry")
 
@@ -14,12 +14,35 @@ class _MetricsStore:
         self._gauges: Dict[str, float] = {}
         self._counters: Dict[str, float] = {}
         self._heartbeats: Dict[str, float] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], float]] = {}
         self._lock = threading.RLock()
 
     def set_gauge(self, name: str, value: float):
         with self._lock:
             self._gauges[name] = float(value)
 
+    def set_gauges(self, values: Dict[str, float]):
+        with self._lock:
+            gauges = self._gauges
+            for name, value in values.items():
+                gauges[name] = value if type(value) is float else float(value)
+
+    def register_gauge_callback(self, name: str, fn: Callable[[], float]):
+        with self._lock:
+            self._gauge_callbacks[name] = fn
+
+    def computed_gauges(self) -> Dict[str, float]:
+        # Pull-based gauges, evaluated only when /metrics is scraped.
+        with self._lock:
+            callbacks = list(self._gauge_callbacks.items())
+        out: Dict[str, float] = {}
+        for name, fn in callbacks:
+            try:
+                out[name] = float(fn())
+            except Exception as exc:
+                LOG.debug("[telemetry] gauge callback %s failed: %s", name, exc)
+        return out
+
     def inc_counter(self, name: str, inc: float = 1.0):
         with self._lock:
             self._counters[name] = self._counters.get(name, 0.0) + float(inc)
@@ -28,6 +51,10 @@ class _MetricsStore:
         with self._lock:
             self._heartbeats[name] = time.time()
 
+    def get_heartbeats(self) -> Dict[str, float]:
+        # Live dict, not a copy: callers must treat it as read-only.
+        return self._heartbeats
+
     def snapshot(self):
         with self._lock:
             return dict(self._gauges), dict(self._counters), dict(self._heartbeats)
@@ -92,6 +119,7 @@ class Telemetry:
                     self.end_headers()
                     return
                 gauges, counters, heartbeats = store.snapshot()
+                gauges.update(store.computed_gauges())
                 body = []
                 now = time.time()
 
@@ -132,11 +160,20 @@ class Telemetry:
     def set_gauge(self, name: str, value: float):
         self.metrics.set_gauge(name, value)
 
+    def set_gauges(self, values: Dict[str, float]):
+        self.metrics.set_gauges(values)
+
+    def register_gauge_callback(self, name: str, fn: Callable[[], float]):
+        self.metrics.register_gauge_callback(name, fn)
+
     def inc_counter(self, name: str, inc: float = 1.0):
         self.metrics.inc_counter(name, inc)
 
     def heartbeat(self, name: str):
         self.metrics.heartbeat(name)
 
+    def get_heartbeats(self) -> Dict[str, float]:
+        return self.metrics.get_heartbeats()
+
     # Convenience aliases used by other modules
     touch = heartbeat
@@ -216,6 +216,7 @@ def cmd_import_json(args: argparse.Namespace) -> int:
         ledger.append(event)
         appended += 1
 
+    ledger.close()
     print(f"imported {appended} trades into ledger")
     return 0
 
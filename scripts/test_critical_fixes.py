@@ -8,12 +8,15 @@ Quick test script to verify critical fixes work:
 
 import sys
 import os
+import tempfile
+from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from decimal import Decimal
 from core.state_store import StateStore
+from metrics.ledger import FillEvent, MetricsLedger
 from modules.self_trade_guard import SelfTradeGuard
 from modules.maker_engine import MakerEngine
 
@@ -100,6 +103,16 @@ def test_inventory_tracking():
     print(f"✓ All inventory: {all_inv}")
     assert "market:1" in all_inv and "market:2" in all_inv, "Should have both markets"
 
+    # Reads through the view must not create entries for unknown markets
+    assert all_inv.get("market:3") is None
+    assert "market:3" not in all_inv, "View reads should not insert"
+    assert len(all_inv) == 2, "View reads should not insert"
+
+    # Deltas on a new market start from zero
+    state.update_inventory("market:3", Decimal("-0.004"))
+    assert state.get_inventory("market:3") == Decimal("-0.004")
+    assert len(all_inv) == 3, "View should reflect later updates"
+
     print("✅ All inventory tracking tests passed!\n")
 
 
@@ -140,6 +153,43 @@ def test_order_tracking():
     print("✅ All order tracking tests passed!\n")
 
 
+def test_order_market_index():
+    """Test that the per-market order index follows upserts, moves and removals."""
+    print("=" * 60)
+    print("TEST 6: Per-Market Order Index")
+    print("=" * 60)
+
+    state = StateStore()
+    state.add_order("a", {"side": "bid", "market": "market:1"})
+    state.add_order("b", {"side": "ask", "market": "market:1"})
+    state.add_order("c", {"side": "bid", "market": "market:2"})
+
+    # Upsert in place keeps one entry with the new info
+    state.add_order("a", {"side": "ask", "market": "market:1"})
+    market1 = state.get_orders("market:1")
+    assert sorted(market1) == ["a", "b"], f"Unexpected market:1 orders: {list(market1)}"
+    assert market1["a"]["side"] == "ask", "Upsert should replace order info"
+    print("✓ Upsert keeps a single, updated entry")
+
+    # Re-adding under another market moves the order between buckets
+    state.add_order("b", {"side": "ask", "market": "market:2"})
+    assert sorted(state.get_orders("market:1")) == ["a"]
+    assert sorted(state.get_orders("market:2")) == ["b", "c"]
+    print("✓ Market change moves the order to the new market")
+
+    # Removal updates both views; emptied markets return no orders
+    assert state.remove_order("a")["market"] == "market:1"
+    assert state.remove_order("a") is None, "Second removal should be a no-op"
+    assert len(state.get_orders("market:1")) == 0
+    state.remove_order("c")
+    assert sorted(state.get_orders("market:2")) == ["b"]
+    assert sorted(state.get_orders()) == ["b"]
+    assert len(state.get_orders("market:99")) == 0
+    print("✓ Removals keep per-market lookups in step with open orders")
+
+    print("✅ All order index tests passed!\n")
+
+
 def test_guard_with_state_store():
     """Test that SelfTradeGuard works with StateStore methods."""
     print("=" * 60)
@@ -174,6 +224,81 @@ def test_guard_with_state_store():
     print("✅ Guard + StateStore integration tests passed!\n")
 
 
+def _fill(ts: float) -> FillEvent:
+    return FillEvent(
+        timestamp=ts,
+        market="market:1",
+        role="maker",
+        side="bid",
+        size="0.001",
+        price="100000",
+        notional="100",
+        base_delta="0.001",
+        quote_delta="-100",
+        fee_paid="0",
+    )
+
+
+def test_ledger_durability():
+    """Test that MetricsLedger appends reach disk without close()."""
+    print("=" * 60)
+    print("TEST 5: Fill Ledger Durability")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "fills.jsonl"
+        ledger = MetricsLedger(path, archive_dir=Path(tmp) / "archive")
+
+        # Back-to-back appends with the handle still open
+        ledger.append(_fill(1.0))
+        ledger.append(_fill(2.0))
+        on_disk = path.read_bytes().count(b"\n")
+        print(f"✓ Lines on disk before close: {on_disk} (expected: 2)")
+        assert on_disk == 2, "Every append should be flushed"
+
+        timestamps = [e.timestamp for e in ledger.iter_events()]
+        assert timestamps == [1.0, 2.0], f"Unexpected events: {timestamps}"
+        assert [e.timestamp for e in ledger.iter_events(since_ts=2.0)] == [2.0]
+
+        # Appending after close() reopens the handle
+        ledger.close()
+        ledger.append(_fill(3.0))
+        assert path.read_bytes().count(b"\n") == 3, "Append after close should reopen"
+
+        # Reset archives the file and starts fresh
+        archived = ledger.reset()
+        assert archived is not None and archived.read_bytes().count(b"\n") == 3
+        ledger.append(_fill(4.0))
+        assert [e.timestamp for e in ledger.iter_events()] == [4.0]
+        print("✓ Close/reopen and reset keep the ledger consistent")
+
+        # A reset through another instance (e.g. metrics_tool reset in a
+        # separate process) must not leave the open handle on the archive
+        other = MetricsLedger(path, archive_dir=Path(tmp) / "archive2")
+        archived = other.reset()
+        assert archived is not None and not path.exists()
+        for ts in (5.0, 6.0, 7.0):
+            ledger.append(_fill(ts))
+        assert [e.timestamp for e in ledger.iter_events()] == [5.0, 6.0, 7.0]
+        assert archived.read_bytes().count(b"\n") == 1, "Archive should not grow"
+        ledger.close()
+        print("✓ Appends follow the live path after an external reset")
+
+        # Size rotation looks at the file on disk, not the handle position
+        line_len = len(path.read_bytes()) // 3
+        rotating = MetricsLedger(
+            path, archive_dir=Path(tmp) / "archive3", max_bytes=line_len * 4
+        )
+        rotating.append(_fill(8.0))
+        assert path.read_bytes().count(b"\n") == 4
+        rotating.append(_fill(9.0))
+        assert [e.timestamp for e in rotating.iter_events()] == [9.0]
+        rotating.close()
+        print("✓ Size rotation archives the live file")
+
+    print("✅ All ledger durability tests passed!\n")
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -183,8 +308,10 @@ def main():
     try:
         test_inventory_tracking()
         test_order_tracking()
+        test_order_market_index()
         test_guard_blocking()
         test_guard_with_state_store()
+        test_ledger_durability()
 
         print("=" * 60)
         print("✅ ALL TESTS PASSED!")
@@ -193,7 +320,9 @@ def main():
         print("  ✓ SelfTradeGuard blocks invalid quotes")
         print("  ✓ Inventory tracking works correctly")
         print("  ✓ Order tracking works correctly")
+        print("  ✓ Per-market order index stays consistent")
         print("  ✓ Guard integrates with StateStore")
+        print("  ✓ Fill ledger appends are durable")
         print("\nNote: Cancel discipline requires runtime testing (see test_chaos.py)")
         return 0
     except AssertionError as e:
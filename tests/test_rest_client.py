@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from core.rest_client import RestClient, RestConfig  # noqa: E402
+
+
+def test_shared_session_per_loop():
+    async def open_sessions():
+        a = RestClient(RestConfig(base_url="http://a.invalid"))
+        b = RestClient(RestConfig(base_url="http://b.invalid"))
+        session = await a.get_shared_session()
+        assert await b.get_shared_session() is session
+
+        # Instance close must not tear down the session other clients use.
+        await a.close()
+        assert not session.closed
+
+        await RestClient.close_shared_session()
+        assert session.closed
+        return session
+
+    first = asyncio.run(open_sessions())
+    # A new loop gets its own session instead of one bound to a dead loop.
+    second = asyncio.run(open_sessions())
+    assert second is not first
+    assert not RestClient._shared_sessions
+
+
+class _StubRestClient(RestClient):
+    """RestClient with the HTTP layer replaced by canned batch responses."""
+
+    def __init__(self):
+        super().__init__(RestConfig(base_url="http://metrics.invalid"))
+        self.requests = []
+
+    async def _get(self, path, params=None):
+        self.requests.append((path, params))
+        symbols = params["symbols"].split(",") if params else ["1", "2", "3"]
+        return {
+            "data": [{"market_id": f"market:{s}", "funding_8h": 0.001} for s in symbols]
+        }
+
+
+def test_fetch_pair_metrics_all_markets_and_batches():
+    client = _StubRestClient()
+
+    # Zero-arg call (the FundingDataSource contract) fetches every market.
+    metrics = asyncio.run(client.fetch_pair_metrics())
+    assert [m.market_id for m in metrics] == ["market:1", "market:2", "market:3"]
+    assert client.requests == [("metrics/batch", None)]
+
+    # Explicit symbols are chunked into concurrent batch requests.
+    metrics = asyncio.run(client.fetch_pair_metrics(["5", "4", "6"], chunk=2))
+    assert sorted(m.market_id for m in metrics) == ["market:4", "market:5", "market:6"]
+    assert client.requests[1:] == [
+        ("metrics/batch", {"symbols": "4,5"}),
+        ("metrics/batch", {"symbols": "6"}),
+    ]
+
+    # Served from the TTL cache: no new requests.
+    asyncio.run(client.fetch_pair_metrics())
+    assert len(client.requests) == 3
+
+
+class _RowsRestClient(RestClient):
+    """RestClient whose batch endpoint returns fixed rows, or fails."""
+
+    def __init__(self, rows=None, error=None):
+        super().__init__(RestConfig(base_url="http://metrics.invalid"))
+        self.rows = rows
+        self.error = error
+        self.calls = 0
+
+    async def _get(self, path, params=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return {"data": self.rows}
+
+
+def test_fetch_pair_metrics_coerces_and_skips_bad_rows():
+    client = _RowsRestClient(
+        rows=[
+            {"market_id": "market:1", "funding_8h": "0.0001", "open_interest": 5},
+            {"market_id": "market:2", "funding_8h": "n/a"},
+            {"market_id": "market:3", "spread_bps": "2.5", "unexpected": 1},
+        ]
+    )
+    metrics = asyncio.run(client.fetch_pair_metrics())
+    assert [m.market_id for m in metrics] == ["market:1", "market:3"]
+    assert metrics[0].funding_8h == 0.0001
+    assert isinstance(metrics[0].open_interest, float)
+    assert metrics[1].spread_bps == 2.5
+
+
+def test_fetch_pair_metrics_caches_failures():
+    client = _RowsRestClient(error=RuntimeError("endpoint down"))
+    assert asyncio.run(client.fetch_pair_metrics()) == []
+    assert asyncio.run(client.fetch_pair_metrics()) == []
+    assert client.calls == 1
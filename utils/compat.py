@@ -21,8 +21,16 @@ class ConfigCompat(SimpleNamespace):
     ):
         # load base into namespace first
         super().__init__(**base)
-        self.__dict__["_defaults"] = defaults
-        self.__dict__["_aliases"] = aliases
+        ns = self.__dict__
+        ns["_defaults"] = defaults
+        ns["_aliases"] = aliases
+        # Pre-resolve defaults and aliases so known names are plain attribute
+        # hits; __getattr__ is then only entered for unknown names.
+        for name, value in defaults.items():
+            ns.setdefault(name, value)
+        for alias, target in aliases.items():
+            if alias not in ns and target in ns:
+                ns[alias] = ns[target]
 
     def __getattr__(self, name: str) -> Any:
         # exact